@@ -5,6 +5,7 @@
 """
 
 import os
+from functools import lru_cache
 
 # 应用信息
 APP_NAME = "农业视觉问答助手"
@@ -155,50 +156,59 @@ EXPERIMENTAL_CONFIG = {
 }
 
 
+# 本进程内已创建过的目录，避免重复调用 makedirs
+_CREATED_DIRS = set()
+
+
 def create_directories():
     """创建必要的目录"""
     for path in PATHS.values():
+        if path in _CREATED_DIRS:
+            continue
         os.makedirs(path, exist_ok=True)
+        _CREATED_DIRS.add(path)
+
+
+# 配置分区映射（内部字典可变，set_config_value 的修改会直接反映出来）
+_CONFIG_MAP = {
+    "window": WINDOW_CONFIG,
+    "image": IMAGE_CONFIG,
+    "drawing": DRAWING_CONFIG,
+    "chat": CHAT_CONFIG,
+    "inference": INFERENCE_CONFIG,
+    "logging": LOGGING_CONFIG,
+    "performance": PERFORMANCE_CONFIG,
+    "ui": UI_CONFIG,
+    "shortcuts": SHORTCUTS,
+    "network": NETWORK_CONFIG,
+    "security": SECURITY_CONFIG,
+    "experimental": EXPERIMENTAL_CONFIG
+}
+
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=256)
+def _lookup_config_value(section, key):
+    """查找配置值（带缓存），不存在时返回 _MISSING"""
+    try:
+        return _CONFIG_MAP[section][key]
+    except KeyError:
+        return _MISSING
 
 
 def get_config_value(section, key, default=None):
     """获取配置值"""
-    config_map = {
-        "window": WINDOW_CONFIG,
-        "image": IMAGE_CONFIG,
-        "drawing": DRAWING_CONFIG,
-        "chat": CHAT_CONFIG,
-        "inference": INFERENCE_CONFIG,
-        "logging": LOGGING_CONFIG,
-        "performance": PERFORMANCE_CONFIG,
-        "ui": UI_CONFIG,
-        "shortcuts": SHORTCUTS,
-        "network": NETWORK_CONFIG,
-        "security": SECURITY_CONFIG,
-        "experimental": EXPERIMENTAL_CONFIG
-    }
-
-    return config_map.get(section, {}).get(key, default)
+    value = _lookup_config_value(section, key)
+    return default if value is _MISSING else value
 
 
 def set_config_value(section, key, value):
     """设置配置值"""
-    config_map = {
-        "window": WINDOW_CONFIG,
-        "image": IMAGE_CONFIG,
-        "drawing": DRAWING_CONFIG,
-        "chat": CHAT_CONFIG,
-        "inference": INFERENCE_CONFIG,
-        "logging": LOGGING_CONFIG,
-        "performance": PERFORMANCE_CONFIG,
-        "ui": UI_CONFIG,
-        "shortcuts": SHORTCUTS,
-        "network": NETWORK_CONFIG,
-        "security": SECURITY_CONFIG,
-        "experimental": EXPERIMENTAL_CONFIG
-    }
-
-    if section in config_map:
-        config_map[section][key] = value
-        return True
-    return False
\ No newline at end of file
+    config = _CONFIG_MAP.get(section)
+    if config is None:
+        return False
+    config[key] = value
+    _lookup_config_value.cache_clear()
+    return True
\ No newline at end of file
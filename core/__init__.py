@@ -15,6 +15,7 @@ __all__ = [
     'encode_image_base64',
     'create_polygon_mask',
     'calculate_polygon_area',
+    'polygon_centroids_areas',
     'point_in_polygon',
     'simplify_polygon',
     'process_regions_for_model',
@@ -5,25 +5,66 @@
 负责AI模型的加载、推理和管理
 """
 
-from PyQt5.QtCore import QObject, pyqtSignal, QThread, QTimer
+from PyQt5.QtCore import Qt, QObject, pyqtSignal, QRunnable, QThreadPool, QTimer
 import threading
 import time
 import base64
+import copy
 import io
 import json
+import math
+import os
+import weakref
+from collections import OrderedDict
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image
 import numpy as np
 
-from .utils import process_regions_for_model, encode_image_base64
+from config.settings import IMAGE_CONFIG, PERFORMANCE_CONFIG
+from .utils import (process_regions_for_model, encode_image_base64, resize_image,
+                    load_config, save_config, _json_dumps, _json_loads)
 
 
-class InferenceWorker(QThread):
-    """推理工作线程"""
+MODEL_CONFIG_PATH = "config/model_config.json"
+BACKEND_API_URL = "https://farmxpert.vip.cpolar.cn"
+IMAGE_CACHE_SIZE = 4  # 最多缓存的整图编码数量
+REGION_TILE_SIZE = 512  # 区域拼图中每个格子的边长
+API_PROBE_CACHE_PATH = "cache/api_probe.json"
+API_PROBE_TTL = 300  # 探活结果有效期（秒）
+WARMUP_IDLE_SECONDS = 60  # 后端连接空闲超过该时长才重新预热
+
+# 提示词的固定前缀和后缀
+_PROMPT_PREFIX = """你是一个专业的农业视觉分析助手。请根据提供的图像回答用户的问题。
+
+                    图像信息：
+                    - 这是一张农业相关的图片
+                    - 用户可能在图片上标注了感兴趣的区域
+                    
+                    """
+_PROMPT_SUFFIX = """请提供专业、详细的回答。如果问题涉及特定区域，请结合区域信息进行分析。
+                        回答要求：
+                        1. 使用中文回答
+                        2. 内容要专业、准确
+                        3. 如果涉及农业诊断，请提供具体建议
+                        4. 保持回答的结构化和易读性"""
+
+# 已解析的模型配置缓存，键为 (路径, mtime_ns)，文件修改后自动失效
+_CONFIG_CACHE = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+class InferenceSignals(QObject):
+    """推理任务信号（QRunnable 不是 QObject，信号需单独承载）"""
     
     finished = pyqtSignal(str)  # 推理完成信号
     error = pyqtSignal(str)     # 错误信号
     progress = pyqtSignal(int)  # 进度信号
+
+
+class InferenceWorker(QRunnable):
+    """推理任务，由线程池复用线程执行"""
     
     def __init__(self, model_manager, question, image, regions):
         super().__init__()
@@ -31,23 +72,32 @@ class InferenceWorker(QThread):
         self.question = question
         self.image = image
         self.regions = regions
-        self.is_cancelled = False
+        self.signals = InferenceSignals()
+        self._cancel_event = threading.Event()
+        self._done_event = threading.Event()
+    
+    @property
+    def is_cancelled(self):
+        return self._cancel_event.is_set()
     
     def run(self):
         """运行推理"""
         try:
             # 模拟进度更新
-            self.progress.emit(10)
+            self.signals.progress.emit(10)
             
             if self.is_cancelled:
                 return
             
+            # 预热后端连接，让 TLS 握手与图像编码并行进行
+            self.model_manager._warm_up_connection()
+            
             # 预处理图像和区域
             processed_data = self.model_manager._preprocess_input(
                 self.question, self.image, self.regions
             )
             
-            self.progress.emit(30)
+            self.signals.progress.emit(30)
             
             if self.is_cancelled:
                 return
@@ -55,7 +105,7 @@ class InferenceWorker(QThread):
             # 执行推理
             result = self.model_manager._run_inference(processed_data)
             
-            self.progress.emit(80)
+            self.signals.progress.emit(80)
             
             if self.is_cancelled:
                 return
@@ -63,18 +113,52 @@ class InferenceWorker(QThread):
             # 后处理结果
             answer = self.model_manager._postprocess_result(result)
             
-            self.progress.emit(100)
+            self.signals.progress.emit(100)
             
             if not self.is_cancelled:
-                self.finished.emit(answer)
+                self.signals.finished.emit(answer)
                 
         except Exception as e:
             if not self.is_cancelled:
-                self.error.emit(str(e))
+                self.signals.error.emit(str(e))
+        finally:
+            self._done_event.set()
     
     def cancel(self):
         """取消推理"""
-        self.is_cancelled = True
+        self._cancel_event.set()
+    
+    def is_running(self):
+        """任务是否尚未结束"""
+        return not self._done_event.is_set()
+    
+    def wait(self):
+        """等待任务结束"""
+        self._done_event.wait()
+
+
+class HealthCheckSignals(QObject):
+    """探活任务信号"""
+    
+    succeeded = pyqtSignal()   # 探活成功
+    failed = pyqtSignal(str)   # 探活失败
+
+
+class HealthCheckWorker(QRunnable):
+    """API 探活任务，在线程池中执行，避免阻塞界面"""
+    
+    def __init__(self, model_manager):
+        super().__init__()
+        self.model_manager = model_manager
+        self.signals = HealthCheckSignals()
+    
+    def run(self):
+        """运行探活"""
+        try:
+            self.model_manager._probe_api()
+            self.signals.succeeded.emit()
+        except Exception as e:
+            self.signals.failed.emit(f"模型加载失败: {str(e)}")
 
 
 class ModelManager(QObject):
@@ -93,11 +177,58 @@ class ModelManager(QObject):
         self.model = None
         self.is_loaded = False
         self.current_worker = None
+        self._health_worker = None
+        # 复用推理线程，避免每次提问都创建/销毁线程
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(PERFORMANCE_CONFIG["thread_pool_size"])
         self.model_config = self.load_model_config()
+        # 整图缓存（LRU）：(id(image), size) -> (弱引用, 缩放后图像, base64)，同一张图重复提问时跳过缩放和编码
+        self._image_cache = OrderedDict()
+        # 区域信息缓存：(区域指纹, region_info)，连续提问且未改动区域时复用
+        self._regions_cache = None
+        # 复用 HTTP 连接，避免每次请求都重新握手
+        self._session = self._create_session()
+        self._warmup_lock = threading.Lock()
+        self._last_backend_request = float("-inf")  # 最近一次访问后端的时间（monotonic）
         
         # 自动加载模型
         QTimer.singleShot(1000, self.load_model)
 
+    def _create_session(self):
+        """创建带连接池和重试策略的 HTTP 会话"""
+        session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _warm_up_connection(self):
+        """
+        连接空闲较久时，在后台向后端发一个 HEAD 请求，提前建立 keep-alive 连接
+
+        走正式会话，建立的连接直接留在其连接池中供后续请求复用。
+        最近刚访问过后端（连接仍在池中）或已有预热在进行时直接返回，
+        因此后端不可达时重试也最多每个空闲周期发生一次；
+        预热线程为守护线程，不会拖住程序退出。
+        """
+        now = time.monotonic()
+        if now - self._last_backend_request < WARMUP_IDLE_SECONDS:
+            return
+        if not self._warmup_lock.acquire(blocking=False):
+            return
+        self._last_backend_request = now
+
+        def warm_up():
+            try:
+                self._session.head(BACKEND_API_URL, timeout=2)
+            except requests.exceptions.RequestException:
+                pass  # 预热失败不影响正式请求
+            finally:
+                self._warmup_lock.release()
+
+        threading.Thread(target=warm_up, name="backend-warmup", daemon=True).start()
+
     def load_model_config(self):
         default_config = {
             "model_type": "api",
@@ -110,14 +241,22 @@ class ModelManager(QObject):
             "temperature": 0.7
         }
         try:
-            with open("config/model_config.json", "r", encoding="utf-8") as f:
-                config = json.load(f)
-                cfg = {**default_config, **config}
+            st = os.stat(MODEL_CONFIG_PATH)
+            key = (MODEL_CONFIG_PATH, st.st_mtime_ns)
+            with _CONFIG_CACHE_LOCK:
+                cached = _CONFIG_CACHE.get(key)
+                if cached is None:
+                    with open(MODEL_CONFIG_PATH, "r", encoding="utf-8") as f:
+                        config = json.load(f)
+                    cached = {**default_config, **config}
+                    _CONFIG_CACHE.clear()  # 旧版本的配置不再需要
+                    _CONFIG_CACHE[key] = cached
+            # 返回副本，避免调用方修改污染缓存
+            cfg = copy.copy(cached)
         except FileNotFoundError:
             cfg = default_config
 
         # 允许用环境变量兜底
-        import os
         if not cfg["api_key"]:
             cfg["api_key"] = os.getenv("OPENAI_API_KEY", "")
 
@@ -136,25 +275,51 @@ class ModelManager(QObject):
 
     def _load_api_model(self):
         """加载API模型（OpenAI 兼容）"""
+        health_url = self._get_health_url()
+        if self._is_probe_cached(health_url):
+            self._on_api_probe_succeeded()
+            return
+
+        # 探活请求放到线程池中执行，结果以排队连接投递回主线程
+        self._health_worker = HealthCheckWorker(self)
+        self._health_worker.signals.succeeded.connect(self._on_api_probe_succeeded, Qt.QueuedConnection)
+        self._health_worker.signals.failed.connect(self.model_load_failed, Qt.QueuedConnection)
+        self._thread_pool.start(self._health_worker)
+
+    def _get_health_url(self):
+        return self.model_config.get("health_url") or self.model_config["api_url"].rsplit("/", 1)[
+            0] + "/models"
+
+    def _is_probe_cached(self, health_url):
+        """最近一次探活是否成功且仍在有效期内"""
+        probe = load_config(API_PROBE_CACHE_PATH, {})
+        return (probe.get("ok") is True and probe.get("url") == health_url
+                and time.time() - probe.get("probed_at", 0) < API_PROBE_TTL)
+
+    def _probe_api(self):
+        """请求探活接口，失败时抛出异常（在工作线程中调用）"""
         try:
             headers = {"Authorization": f"Bearer {self.model_config['api_key']}"}
-            health_url = self.model_config.get("health_url") or self.model_config["api_url"].rsplit("/", 1)[
-                0] + "/models"
-            resp = requests.get(health_url, headers=headers, timeout=10)
+            resp = self._session.get(self._get_health_url(), headers=headers, timeout=10)
 
             if resp.status_code == 200:
                 # 可选：检查目标模型是否存在（有些代理不列出模型，此步可跳过）
-                # data = resp.json().get("data", [])
+                # data = orjson.loads(resp.content).get("data", [])
                 # models = {m.get("id") for m in data if isinstance(m, dict)}
                 # if self.model_config["model_name"] not in models:
                 #     print("提示：目标模型可能不在 models 列表中，但不影响调用。")
-                self.is_loaded = True
-                self.model_loaded.emit()
+                save_config({"probed_at": time.time(), "ok": True, "url": self._get_health_url()},
+                            API_PROBE_CACHE_PATH)
             else:
                 raise Exception(f"探活失败: {resp.status_code} {resp.text[:200]}")
 
         except requests.exceptions.RequestException as e:
             raise Exception(f"无法连接到 OpenAI 兼容 API: {str(e)}")
+
+    def _on_api_probe_succeeded(self):
+        """探活成功处理"""
+        self.is_loaded = True
+        self.model_loaded.emit()
     
     def _load_local_model(self):
         """加载本地模型"""
@@ -169,75 +334,135 @@ class ModelManager(QObject):
             return
         
         # 取消当前推理
-        if self.current_worker and self.current_worker.isRunning():
+        if self.current_worker and self.current_worker.is_running():
             self.current_worker.cancel()
             self.current_worker.wait()
         
-        # 创建新的推理线程
+        # 创建新的推理任务；信号在线程池线程中发出，显式排队投递到主线程，工作线程不等待界面
         self.current_worker = InferenceWorker(self, question, image, regions)
-        self.current_worker.finished.connect(self._on_inference_finished)
-        self.current_worker.error.connect(self._on_inference_error)
-        self.current_worker.progress.connect(self.inference_progress.emit)
+        signals = self.current_worker.signals
+        signals.finished.connect(self._on_inference_finished, Qt.QueuedConnection)
+        signals.error.connect(self._on_inference_error, Qt.QueuedConnection)
+        signals.progress.connect(self.inference_progress, Qt.QueuedConnection)
         
         # 发送开始信号
         self.inference_started.emit()
         
-        # 开始推理
-        self.current_worker.start()
+        # 提交到线程池开始推理
+        self._thread_pool.start(self.current_worker)
+
+    def _prepare_full_image(self, image):
+        """缩放并编码整图，同一图像对象只处理一次"""
+        key = (id(image), image.size)
+        entry = self._image_cache.get(key)
+        if entry is not None and entry[0]() is image:
+            self._image_cache.move_to_end(key)
+            return entry[1], entry[2]
+
+        # 视觉编码器本身会重采样，先缩小可大幅减少编码耗时和传输量
+        model_image = resize_image(image, IMAGE_CONFIG["max_display_size"])
+        image_base64 = encode_image_base64(model_image)
+        self._image_cache[key] = (weakref.ref(image), model_image, image_base64)
+        self._image_cache.move_to_end(key)
+        while len(self._image_cache) > IMAGE_CACHE_SIZE:
+            self._image_cache.popitem(last=False)
+        return model_image, image_base64
+
+    def _scale_regions(self, regions, src_size, dst_size):
+        """将区域坐标从原图尺寸换算到缩放后的尺寸"""
+        if src_size == dst_size:
+            return regions
+        scale = np.array([dst_size[0] / src_size[0], dst_size[1] / src_size[1]])
+        scaled = []
+        for r in regions:
+            if 'points' not in r:
+                continue
+            points_array = np.asarray(r['points'], dtype=np.float64) * scale
+            scaled.append({**r, 'points': [tuple(p) for p in points_array.tolist()],
+                           'points_array': points_array})
+        return scaled
+
+    def _get_region_info(self, regions, src_size, dst_size):
+        """处理区域信息，区域未变化时直接复用上一次的结果"""
+        key = (src_size, dst_size,
+               tuple((r.get('id'), r.get('name'), tuple(map(tuple, r.get('points', ()))))
+                     for r in regions))
+        if self._regions_cache is not None and self._regions_cache[0] == key:
+            return self._regions_cache[1]
+
+        scaled = self._scale_regions(regions, src_size, dst_size)
+        region_info = process_regions_for_model(scaled, dst_size)
+        self._regions_cache = (key, region_info)
+        return region_info
 
     def _preprocess_input(self, question, image, regions):
-        from PIL import ImageDraw
-
-        image_base64 = encode_image_base64(image)
-        region_info = process_regions_for_model(regions, image.size)
-
-        # 生成每个 region 的裁剪图（最小外接矩形；如需更精确可以做多边形掩膜）
-        region_crops = []
-        for idx, r in enumerate(region_info, 1):
-            xs = [p[0] for p in r["points"]]
-            ys = [p[1] for p in r["points"]]
-            x1, y1, x2, y2 = max(int(min(xs)), 0), max(int(min(ys)), 0), int(max(xs)), int(max(ys))
-            crop = image.crop((x1, y1, x2, y2))
-            # 可选：在裁剪图上把多边形描出来，增强可读性
-            # draw = ImageDraw.Draw(crop); ...（略）
-            buf_b64 = encode_image_base64(crop)
-            region_crops.append({"tag": f"region{idx}", "bbox": (x1, y1, x2, y2), "b64": buf_b64})
+        model_image, image_base64 = self._prepare_full_image(image)
+        region_info = self._get_region_info(regions, image.size, model_image.size)
 
         prompt = self._build_prompt(question, region_info)
 
         return {
             "prompt": prompt,
-            "image": image_base64,  # 整图
-            "regions": region_info,  # 文本信息
-            "region_crops": region_crops,  # 新增：裁剪图
+            "image": image_base64,  # 整图（已缩放）
+            "regions": region_info,  # 文本信息，坐标与缩放后的整图一致
+            "source_image": model_image,  # 缩放后的整图，裁剪图在需要时再生成
             "original_question": question
         }
+
+    def _build_region_sheet(self, image, region_info):
+        """
+        将所有 region 的裁剪图拼成一张网格图（仅在回退到 OpenAI 兼容接口时使用）
+
+        Returns:
+            (拼图 base64, 每个区域的 tag/bbox/行列位置列表)；没有区域时返回 (None, [])
+        """
+        if not region_info:
+            return None, []
+
+        cols = math.ceil(math.sqrt(len(region_info)))
+        rows = math.ceil(len(region_info) / cols)
+        tile = REGION_TILE_SIZE
+        sheet = Image.new("RGB", (cols * tile, rows * tile))
+
+        # 最小外接矩形；如需更精确可以做多边形掩膜
+        # 所有区域的点拼接成一个数组，一次 reduceat 算出全部外接矩形
+        lens = np.fromiter((len(r["points"]) for r in region_info), dtype=np.int64, count=len(region_info))
+        offsets = np.concatenate(([0], np.cumsum(lens)[:-1]))
+        pts = np.concatenate([np.asarray(r["points"], dtype=np.int32) for r in region_info])
+        width, height = image.size
+        x_min = np.maximum(np.minimum.reduceat(pts[:, 0], offsets), 0).tolist()
+        y_min = np.maximum(np.minimum.reduceat(pts[:, 1], offsets), 0).tolist()
+        x_max = np.minimum(np.maximum.reduceat(pts[:, 0], offsets), width).tolist()
+        y_max = np.minimum(np.maximum.reduceat(pts[:, 1], offsets), height).tolist()
+
+        tiles = []
+        for idx, (x1, y1, x2, y2) in enumerate(zip(x_min, y_min, x_max, y_max), 1):
+            crop = image.crop((x1, y1, max(x2, x1 + 1), max(y2, y1 + 1)))
+            # 可选：在裁剪图上把多边形描出来，增强可读性
+            # draw = ImageDraw.Draw(crop); ...（略）
+            crop.thumbnail((tile, tile), Image.Resampling.LANCZOS)
+
+            row, col = divmod(idx - 1, cols)
+            sheet.paste(crop, (col * tile, row * tile))
+            tiles.append({"tag": f"region{idx}", "bbox": (x1, y1, x2, y2), "row": row + 1, "col": col + 1})
+
+        sheet_b64 = encode_image_base64(sheet, format='WEBP', quality=85)
+        return sheet_b64, tiles
     
     def _build_prompt(self, question, region_info):
         """构建提示词"""
-        base_prompt = """你是一个专业的农业视觉分析助手。请根据提供的图像回答用户的问题。
-
-                    图像信息：
-                    - 这是一张农业相关的图片
-                    - 用户可能在图片上标注了感兴趣的区域
-                    
-                    """
+        parts = [_PROMPT_PREFIX]
         
         if region_info:
-            base_prompt += "用户标注的区域信息：\n"
+            parts.append("用户标注的区域信息：\n")
             for i, region in enumerate(region_info, 1):
-                base_prompt += f"区域{i}: 包含{len(region['points'])}个坐标点\n"
-            base_prompt += "\n"
+                parts.append(f"区域{i}: 包含{len(region['points'])}个坐标点\n")
+            parts.append("\n")
         
-        base_prompt += f"用户问题：{question}\n\n"
-        base_prompt += """请提供专业、详细的回答。如果问题涉及特定区域，请结合区域信息进行分析。
-                        回答要求：
-                        1. 使用中文回答
-                        2. 内容要专业、准确
-                        3. 如果涉及农业诊断，请提供具体建议
-                        4. 保持回答的结构化和易读性"""
+        parts.append(f"用户问题：{question}\n\n")
+        parts.append(_PROMPT_SUFFIX)
         
-        return base_prompt
+        return "".join(parts)
     
     def _run_inference(self, processed_data):
         """运行推理"""
@@ -265,10 +490,10 @@ class ModelManager(QObject):
 
         for region in original_data_list:
             if 'points' in region and isinstance(region['points'], list):
-                points_tuples = region['points']
                 # 将 (x, y) 元组转换为 {'x': x, 'y': y} 字典的列表
-                # 将整数坐标转换为浮点数，以符合目标格式
-                converted_points = [{'x': float(x), 'y': float(y)} for x, y in points_tuples]
+                # 坐标统一经 NumPy 转为浮点数，以符合目标格式
+                points_array = np.asarray(region['points'], dtype=np.float64)
+                converted_points = [{'x': x, 'y': y} for x, y in points_array.tolist()]
                 converted_polygons_list.append(converted_points)
             else:
                 # 如果某个区域没有 'points' 键或其格式不正确，可以选择跳过或报错
@@ -290,20 +515,22 @@ class ModelManager(QObject):
             # }
 
 
-            BACKEND_API_URL = "https://farmxpert.vip.cpolar.cn"
             payload_iPheno = {
                 "image_base64": processed_data['image'],
                 "polygons": self._convert_regions_to_polygons(processed_data['regions'])["polygons"],
                 "prompt": processed_data['original_question'],
                 "chat_history_messages": []
             }
-            response_from_api = requests.post(
+            # 直接序列化为 bytes，省去 str -> bytes 的额外大拷贝
+            self._last_backend_request = time.monotonic()
+            response_from_api = self._session.post(
                 f"{BACKEND_API_URL}/infer",
-                json=payload_iPheno,
+                data=_json_dumps(payload_iPheno),
+                headers={"Content-Type": "application/json"},
                 timeout=300
             )
             response_from_api.raise_for_status()
-            api_data = response_from_api.json()
+            api_data = _json_loads(response_from_api.content)
 
             if api_data.get("status") == "success":
                 response = api_data.get("response", "No response from model.")
@@ -326,14 +553,18 @@ class ModelManager(QObject):
                 # 先放说明文本 + 整图
                 content.append({"type": "text", "text": processed_data["prompt"]})
                 content.append({"type": "image_url",
-                                "image_url": {"url": f"data:image/png;base64,{processed_data['image']}"}})
-
-                # 再逐个放区域的文本提示 + 裁剪图
-                for rc in processed_data.get("region_crops", []):
-                    content.append({"type": "text",
-                                    "text": f"下面这张图是 <{rc['tag']}> 的区域裁剪（bbox={rc['bbox']}）。"})
+                                "image_url": {"url": f"data:image/jpeg;base64,{processed_data['image']}"}})
+
+                # 再放所有区域裁剪图拼成的一张网格图 + 每个格子对应的区域说明
+                sheet_b64, tiles = self._build_region_sheet(processed_data["source_image"],
+                                                            processed_data["regions"])
+                if sheet_b64:
+                    lines = ["下面这张图按网格拼接了各区域的裁剪图（从左到右、从上到下）："]
+                    for t in tiles:
+                        lines.append(f"第{t['row']}行第{t['col']}列是 <{t['tag']}> 的区域裁剪（bbox={t['bbox']}）。")
+                    content.append({"type": "text", "text": "\n".join(lines)})
                     content.append({"type": "image_url",
-                                    "image_url": {"url": f"data:image/png;base64,{rc['b64']}"}})
+                                    "image_url": {"url": f"data:image/webp;base64,{sheet_b64}"}})
 
                 payload = {
                     "model": self.model_config["model_name"],
@@ -345,11 +576,11 @@ class ModelManager(QObject):
                     "Content-Type": "application/json",
                     "Authorization": f"Bearer {self.model_config['api_key']}"
                 }
-                resp = requests.post(self.model_config["api_url"], json=payload,
-                                     headers=headers, timeout=self.model_config["timeout"])
+                resp = self._session.post(self.model_config["api_url"], data=_json_dumps(payload),
+                                          headers=headers, timeout=self.model_config["timeout"])
 
                 if resp.status_code == 200:
-                    return resp.json()
+                    return _json_loads(resp.content)
                 raise Exception(f"API请求失败，状态码: {resp.status_code}，响应: {resp.text[:500]}")
             except requests.exceptions.Timeout:
                 raise Exception("API请求超时")
@@ -394,7 +625,7 @@ class ModelManager(QObject):
     
     def cancel_inference(self):
         """取消当前推理"""
-        if self.current_worker and self.current_worker.isRunning():
+        if self.current_worker and self.current_worker.is_running():
             self.current_worker.cancel()
             self.current_worker.wait()
             self.current_worker = None
@@ -414,6 +645,7 @@ class ModelManager(QObject):
     def cleanup(self):
         """清理资源"""
         self.cancel_inference()
+        self._session.close()
         self.model = None
         self.is_loaded = False
 
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Qt 与 NumPy 互转工具
+QImage 直接引用数组内存，不做额外拷贝
+"""
+
+import numpy as np
+from PyQt5.QtGui import QImage, QPolygonF
+
+
+# (通道数) -> QImage 格式
+_CHANNEL_FORMATS = {
+    1: QImage.Format_Grayscale8,
+    3: QImage.Format_RGB888,
+    4: QImage.Format_RGBA8888,
+}
+
+
+def ndarray_to_qimage(arr: np.ndarray) -> QImage:
+    """
+    将 uint8 数组包装为 QImage
+
+    数组为 C 连续时 QImage 直接引用其内存（零拷贝），调用方必须在 QImage
+    使用期间保持数组存活（例如保存到 self._img_buf）；否则先转为连续数组，
+    再返回自带内存的 QImage 副本。
+
+    Args:
+        arr: (H, W)、(H, W, 3) RGB 或 (H, W, 4) RGBA 的 uint8 数组
+
+    Returns:
+        QImage 对象
+    """
+    if arr.dtype != np.uint8:
+        raise ValueError(f"不支持的数组类型: {arr.dtype}")
+
+    channels = 1 if arr.ndim == 2 else arr.shape[2]
+    image_format = _CHANNEL_FORMATS.get(channels)
+    if image_format is None:
+        raise ValueError(f"不支持的通道数: {channels}")
+
+    height, width = arr.shape[:2]
+    if arr.flags['C_CONTIGUOUS']:
+        # 行步长取数组自身的 strides，不假定为 channels * width
+        return QImage(arr.data, width, height, arr.strides[0], image_format)
+
+    # 临时连续数组在函数返回后即被释放，必须让 QImage 自己持有一份数据
+    contiguous = np.ascontiguousarray(arr)
+    return QImage(contiguous.data, width, height, contiguous.strides[0], image_format).copy()
+
+
+def ndarray_to_qpolygonf(points: np.ndarray) -> QPolygonF:
+    """
+    将 (N, 2) 顶点数组整体拷贝进 QPolygonF
+
+    QPointF 在内存中就是两个连续的 double，直接写入 QPolygonF 的缓冲区，
+    不逐点创建 QPointF 对象。
+
+    Args:
+        points: (N, 2) 顶点坐标数组
+
+    Returns:
+        QPolygonF 对象
+    """
+    pts = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 2)
+    polygon = QPolygonF(len(pts))
+    if len(pts):
+        buffer = polygon.data()
+        buffer.setsize(pts.nbytes)
+        np.frombuffer(buffer, dtype=np.float64)[:] = pts.ravel()
+    return polygon
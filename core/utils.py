@@ -5,39 +5,129 @@
 包含图像处理、多边形处理等实用函数
 """
 
+import atexit
 import os
 import base64
+import datetime
 import io
 import json
+import queue
+import threading
+from functools import lru_cache
 from typing import List, Tuple, Dict, Any, Optional
 import numpy as np
 from PIL import Image, ImageDraw, ImageFilter
-import cv2
 
+try:
+    import cv2
+except ImportError:
+    cv2 = None  # 未安装 OpenCV 时使用下方的扫描线填充等回退实现
 
-def validate_image(file_path: str) -> bool:
+try:
+    # 可选依赖：PyTurboJPEG + libjpeg-turbo，JPEG 编码比 PIL 快 2~3 倍
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _turbo_jpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    _turbo_jpeg = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+        """序列化为 UTF-8 字节串；indent 为 True 时缩进两格（写配置文件用）"""
+        # OPT_NON_STR_KEYS：与 json.dump 一样允许非字符串键
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+except ImportError:
+    # 未安装 orjson 时回退到标准库 json
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+        """序列化为 UTF-8 字节串；indent 为 True 时缩进两格（写配置文件用）"""
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+# 点集判断时点数 × 边数超过该值才改用 numba 内核：
+# 以下规模 NumPy 向量化只需几十毫秒，抵不上导入 numba 和加载内核的开销（约 0.3~0.5 秒）
+PNPOLY_JIT_MIN_WORK = 10_000_000
+# 批量计算中心/面积时总顶点数超过该值才改用 numba 内核：
+# NumPy 按段归约每百万顶点约 15 毫秒，JIT 每百万顶点只省十余毫秒，需要上千万顶点才能抵回首次开销
+CENTROIDS_JIT_MIN_VERTICES = 20_000_000
+
+# 支持的图像扩展名
+_VALID_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp'}
+
+
+@lru_cache(maxsize=None)
+def _numba():
+    """
+    按需导入 numba（可选依赖，导入约需 0.15 秒，因此不在模块导入时加载）
+    
+    Returns:
+        numba 模块；未安装时返回 None
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba
+
+
+def _sniff_image_format(head: bytes) -> Optional[str]:
+    """
+    根据文件头魔数判断图像格式，只需读取前 12 个字节
+    
+    Args:
+        head: 文件开头的字节
+        
+    Returns:
+        图像格式名称，无法识别时返回 None
+    """
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'PNG'
+    if head.startswith(b'\xff\xd8\xff'):
+        return 'JPEG'
+    if head.startswith(b'BM'):
+        return 'BMP'
+    if head[:4] in (b'II*\x00', b'MM\x00*'):
+        return 'TIFF'
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'WEBP'
+    return None
+
+
+def validate_image(file_path: str, strict: bool = False) -> bool:
     """
     验证图像文件是否有效
     
+    默认只检查扩展名和文件头魔数，不解码整张图像；
+    strict 为 True 时再调用 PIL 的 verify() 做完整性校验。
+    
     Args:
         file_path: 图像文件路径
+        strict: 是否进行完整校验
         
     Returns:
         bool: 图像是否有效
     """
     try:
-        if not os.path.exists(file_path):
-            return False
-        
         # 检查文件扩展名
-        valid_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp'}
         ext = os.path.splitext(file_path)[1].lower()
-        if ext not in valid_extensions:
+        if ext not in _VALID_IMAGE_EXTENSIONS:
             return False
         
-        # 尝试打开图像
-        with Image.open(file_path) as img:
-            img.verify()  # 验证图像完整性
+        # 只读取文件头，文件不存在时 open 会直接抛出 FileNotFoundError
+        with open(file_path, 'rb') as f:
+            head = f.read(12)
+        if _sniff_image_format(head) is None:
+            return False
+        
+        if strict:
+            with Image.open(file_path) as img:
+                img.verify()  # 验证图像完整性
         
         return True
         
@@ -58,14 +148,19 @@ def resize_image(image: Image.Image, max_size: Tuple[int, int] = (1024, 1024)) -
     """
     original_size = image.size
     
+    # 已经不超过最大尺寸时直接返回
+    if original_size[0] <= max_size[0] and original_size[1] <= max_size[1]:
+        return image
+    
     # 计算缩放比例
     scale = min(max_size[0] / original_size[0], max_size[1] / original_size[1])
-    
-    if scale < 1:
-        new_size = (int(original_size[0] * scale), int(original_size[1] * scale))
-        return image.resize(new_size, Image.Resampling.LANCZOS)
-    
-    return image
+    new_size = (int(original_size[0] * scale), int(original_size[1] * scale))
+    return image.resize(new_size, Image.Resampling.LANCZOS)
+
+
+def _ensure_mode(image: Image.Image, mode: str) -> Image.Image:
+    """模式已一致时直接返回原对象，否则转换"""
+    return image if image.mode == mode else image.convert(mode)
 
 
 def convert_image_format(image: Image.Image, target_format: str = 'RGB') -> Image.Image:
@@ -79,113 +174,444 @@ def convert_image_format(image: Image.Image, target_format: str = 'RGB') -> Imag
     Returns:
         转换后的图像
     """
-    if image.mode != target_format:
-        return image.convert(target_format)
-    return image
+    return _ensure_mode(image, target_format)
 
 
-def encode_image_base64(image: Image.Image, format: str = 'JPEG', quality: int = 95) -> str:
+def encode_image_base64(image, format: str = 'JPEG', quality: int = 95) -> str:
     """
     将PIL图像编码为base64字符串
     
     Args:
-        image: PIL图像对象
+        image: PIL图像对象，或 OpenCV 约定（BGR/灰度）的 uint8 数组
         format: 图像格式
         quality: 图像质量 (1-100)
         
     Returns:
         base64编码的图像字符串
     """
-    buffer = io.BytesIO()
-    
-    # 确保图像格式正确
-    if format.upper() == 'JPEG' and image.mode != 'RGB':
-        image = image.convert('RGB')
-    
-    image.save(buffer, format=format, quality=quality)
-    buffer.seek(0)
+    fmt = format.upper()
     
-    encoded_image = base64.b64encode(buffer.getvalue()).decode('utf-8')
+    if isinstance(image, np.ndarray) and cv2 is None:
+        # 没有 OpenCV 时把 BGR/BGRA 数组转为 PIL 图像，走下面的 PIL 路径
+        if image.ndim == 3 and image.shape[2] == 3:
+            image = Image.fromarray(np.ascontiguousarray(image[:, :, ::-1]))
+        elif image.ndim == 3 and image.shape[2] == 4:
+            image = Image.fromarray(np.ascontiguousarray(image[:, :, [2, 1, 0, 3]]))
+        else:
+            image = Image.fromarray(image)
+    
+    if isinstance(image, np.ndarray):
+        # OpenCV 数组直接用 cv2 编码，不经过 PIL
+        if fmt == 'JPEG':
+            ok, buf = cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        elif fmt == 'WEBP':
+            ok, buf = cv2.imencode('.webp', image, [cv2.IMWRITE_WEBP_QUALITY, quality])
+        else:
+            ok, buf = cv2.imencode('.' + fmt.lower(), image)
+        if not ok:
+            raise ValueError(f"图像编码失败: {format}")
+        raw = buf.tobytes()
+    elif fmt == 'JPEG':
+        # 确保图像格式正确
+        image = _ensure_mode(image, 'RGB')
+        if _turbo_jpeg is not None:
+            raw = _turbo_jpeg.encode(np.asarray(image), quality=quality, pixel_format=TJPF_RGB)
+        else:
+            buffer = io.BytesIO()
+            image.save(buffer, format=format, quality=quality)
+            raw = buffer.getvalue()
+    else:
+        buffer = io.BytesIO()
+        image.save(buffer, format=format, quality=quality)
+        raw = buffer.getvalue()
+    
+    # base64 结果只含 ASCII 字符
+    encoded_image = base64.b64encode(raw).decode('ascii')
     return encoded_image
 
 
-def create_polygon_mask(points: List[Tuple[float, float]], image_size: Tuple[int, int]) -> np.ndarray:
+def _scanline_fill(mask, xs, ys, value):
+    """
+    扫描线填充多边形（奇偶规则），在 mask 上原地写入 value
+    
+    xs、ys 为已截断为整数的顶点坐标（int64 连续数组）。逐步复现 cv2.fillPoly
+    （8 连通、shift=0）的光栅化规则：每条边先按 cv2.clipLine 裁剪并用 Bresenham
+    描出，再以 16.16 定点数求各行与边的交点并成对填充，因此结果与 OpenCV 路径
+    逐像素一致。安装 numba 时由 _scanline_fill_kernel 编译为释放 GIL 的机器码。
+    """
+    h, w = mask.shape
+    n = xs.shape[0]
+    right = w - 1
+    bottom = h - 1
+    
+    # 非水平边：x 为 16.16 定点数，dx 为每行的增量（向零截断）
+    edge_y0 = np.empty(n, dtype=np.int64)
+    edge_y1 = np.empty(n, dtype=np.int64)
+    edge_x = np.empty(n, dtype=np.int64)
+    edge_dx = np.empty(n, dtype=np.int64)
+    m = 0
+    
+    j = n - 1
+    for i in range(n):
+        x1 = xs[j]
+        y1 = ys[j]
+        x2 = xs[i]
+        y2 = ys[i]
+        y_a = y1
+        y_b = y2
+        j = i
+        
+        # 1. 端点越界时按 cv2.clipLine 的规则裁剪到图像范围内
+        inside = 0 <= x1 <= right and 0 <= x2 <= right and 0 <= y1 <= bottom and 0 <= y2 <= bottom
+        c1 = 0
+        c2 = 0
+        if not inside:
+            if x1 < 0:
+                c1 += 1
+            if x1 > right:
+                c1 += 2
+            if y1 < 0:
+                c1 += 4
+            if y1 > bottom:
+                c1 += 8
+            if x2 < 0:
+                c2 += 1
+            if x2 > right:
+                c2 += 2
+            if y2 < 0:
+                c2 += 4
+            if y2 > bottom:
+                c2 += 8
+            if (c1 & c2) == 0 and (c1 | c2) != 0:
+                if c1 & 12:
+                    a = 0 if c1 < 8 else bottom
+                    x1 += int((a - y1) * float(x2 - x1) / (y2 - y1))
+                    y1 = a
+                    c1 = 0
+                    if x1 < 0:
+                        c1 += 1
+                    if x1 > right:
+                        c1 += 2
+                if c2 & 12:
+                    a = 0 if c2 < 8 else bottom
+                    x2 += int((a - y2) * float(x2 - x1) / (y2 - y1))
+                    y2 = a
+                    c2 = 0
+                    if x2 < 0:
+                        c2 += 1
+                    if x2 > right:
+                        c2 += 2
+                if (c1 & c2) == 0 and (c1 | c2) != 0:
+                    if c1:
+                        a = 0 if c1 == 1 else right
+                        y1 += int((a - x1) * float(y2 - y1) / (x2 - x1))
+                        x1 = a
+                        c1 = 0
+                    if c2:
+                        a = 0 if c2 == 1 else right
+                        y2 += int((a - x2) * float(y2 - y1) / (x2 - x1))
+                        x2 = a
+                        c2 = 0
+        
+        # 2. 8 连通 Bresenham 描边（从左往右画），完全在图像外时跳过
+        if (c1 | c2) == 0:
+            lx1 = x1
+            ly1 = y1
+            lx2 = x2
+            ly2 = y2
+            if lx2 < lx1:
+                lx1, lx2 = lx2, lx1
+                ly1, ly2 = ly2, ly1
+            dx = lx2 - lx1
+            dy = ly2 - ly1
+            sy = 1
+            if dy < 0:
+                dy = -dy
+                sy = -1
+            steep = dy > dx
+            if steep:
+                dx, dy = dy, dx
+            err = dx - 2 * dy
+            px = lx1
+            py = ly1
+            for _ in range(dx + 1):
+                mask[py, px] = value
+                if err < 0:
+                    err += 2 * dx - 2 * dy
+                    if steep:
+                        px += 1
+                    else:
+                        py += sy
+                else:
+                    err -= 2 * dy
+                if steep:
+                    py += sy
+                else:
+                    px += 1
+        
+        # 3. 记录扫描线用的边：斜率取自裁剪后的端点（裁剪后变为水平时沿用原始 y），
+        #    行范围仍取原始端点 [y0, y1)
+        if y_a == y_b:
+            continue
+        ay = y_a
+        by = y_b
+        if not inside and y1 != y2:
+            ay = y1
+            by = y2
+        ax = x1 << 16
+        bx = x2 << 16
+        num = bx - ax
+        den = by - ay
+        q = abs(num) // abs(den)
+        step = -q if (num < 0) != (den < 0) else q
+        edge_dx[m] = step
+        if y_a < y_b:
+            edge_y0[m] = y_a
+            edge_y1[m] = y_b
+            edge_x[m] = ax + (y_a - ay) * step
+        else:
+            edge_y0[m] = y_b
+            edge_y1[m] = y_a
+            edge_x[m] = bx + (y_b - by) * step
+        m += 1
+    
+    if m < 2:
+        return
+    
+    # 4. 逐行求交点（区间 [y0, y1)），排序后成对填充 [ceil(xa), floor(xb)]
+    y_start = max(edge_y0[:m].min(), 0)
+    y_end = min(edge_y1[:m].max(), h)
+    nodes = np.empty(m, dtype=np.int64)
+    for y in range(y_start, y_end):
+        count = 0
+        for k in range(m):
+            if edge_y0[k] <= y < edge_y1[k]:
+                nodes[count] = edge_x[k] + (y - edge_y0[k]) * edge_dx[k]
+                count += 1
+        
+        # 交点数量很少，插入排序即可
+        for a in range(1, count):
+            key = nodes[a]
+            b = a - 1
+            while b >= 0 and nodes[b] > key:
+                nodes[b + 1] = nodes[b]
+                b -= 1
+            nodes[b + 1] = key
+        
+        for k in range(0, count - 1, 2):
+            xa = (nodes[k] + 0xFFFF) >> 16
+            xb = nodes[k + 1] >> 16
+            if xa < w and xb >= 0:
+                for x in range(max(xa, 0), min(xb, right) + 1):
+                    mask[y, x] = value
+
+
+@lru_cache(maxsize=None)
+def _scanline_fill_kernel():
+    """numba 编译的 _scanline_fill（首次调用时才导入 numba）；未安装时返回 None"""
+    numba = _numba()
+    if numba is None:
+        return None
+    return numba.njit(cache=True, nogil=True)(_scanline_fill)
+
+
+def _fill_polygon(mask: np.ndarray, points, value: int) -> None:
+    """在 mask 上填充单个多边形：优先 cv2.fillPoly，其次 numba 扫描线，最后 PIL"""
+    # 三条路径都先把坐标截断为整数，保证结果一致
+    int_points = np.asarray(points, dtype=np.int32).reshape(-1, 2)
+    if cv2 is not None:
+        cv2.fillPoly(mask, [int_points.reshape(-1, 1, 2)], value)
+        return
+    scanline_fill = _scanline_fill_kernel()
+    if scanline_fill is not None:
+        pts = int_points.astype(np.int64)
+        scanline_fill(mask, np.ascontiguousarray(pts[:, 0]), np.ascontiguousarray(pts[:, 1]), value)
+    else:
+        img = Image.fromarray(mask)
+        ImageDraw.Draw(img).polygon([tuple(p) for p in int_points.tolist()], outline=value, fill=value)
+        mask[...] = np.asarray(img)
+
+
+def create_polygon_mask(points: List[Tuple[float, float]], image_size: Tuple[int, int],
+                        out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     根据多边形点创建遮罩
     
     Args:
         points: 多边形顶点坐标列表
         image_size: 图像尺寸 (width, height)
+        out: 可选的预分配 (height, width) uint8 缓冲区，传入时直接复用
         
     Returns:
         二值遮罩数组
     """
-    mask = Image.new('L', image_size, 0)
+    shape = (image_size[1], image_size[0])
+    if out is not None and out.shape == shape and out.dtype == np.uint8:
+        mask = out
+        mask.fill(0)
+    else:
+        mask = np.zeros(shape, dtype=np.uint8)
     
     if len(points) >= 3:
-        # 转换坐标为整数
-        int_points = [(int(x), int(y)) for x, y in points]
-        
-        # 绘制多边形
-        ImageDraw.Draw(mask).polygon(int_points, outline=255, fill=255)
+        _fill_polygon(mask, points, 255)
     
-    return np.array(mask)
+    return mask
 
 
-def calculate_polygon_area(points: List[Tuple[float, float]]) -> float:
+def calculate_polygon_area(points) -> float:
     """
     计算多边形面积（使用鞋带公式）
     
     Args:
-        points: 多边形顶点坐标列表
+        points: 多边形顶点坐标列表，或形状为 (N, 2) 的数组
         
     Returns:
         多边形面积
     """
-    if len(points) < 3:
+    pts = np.asarray(points, dtype=np.float64)
+    if len(pts) < 3:
         return 0.0
     
-    area = 0.0
-    n = len(points)
-    
-    for i in range(n):
-        j = (i + 1) % n
-        area += points[i][0] * points[j][1]
-        area -= points[j][0] * points[i][1]
-    
-    return abs(area) / 2.0
+    x = pts[:, 0]
+    y = pts[:, 1]
+    return float(abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1))) / 2.0)
+
+
+def _centroids_areas_loop(xys, offsets, centroids, areas):
+    """逐个多边形累加顶点坐标和鞋带公式叉积，结果写入 centroids 和 areas"""
+    for k in range(offsets.shape[0] - 1):
+        start = offsets[k]
+        end = offsets[k + 1]
+        sx = 0.0
+        sy = 0.0
+        cross = 0.0
+        for i in range(start, end):
+            j = i + 1 if i + 1 < end else start
+            sx += xys[i, 0]
+            sy += xys[i, 1]
+            cross += xys[i, 0] * xys[j, 1] - xys[j, 0] * xys[i, 1]
+        n = end - start
+        centroids[k, 0] = sx / n
+        centroids[k, 1] = sy / n
+        areas[k] = abs(cross) / 2.0
+
 
+@lru_cache(maxsize=None)
+def _centroids_areas_kernel():
+    """numba 编译的 _centroids_areas_loop（首次调用时才导入 numba）；未安装时返回 None"""
+    numba = _numba()
+    if numba is None:
+        return None
+    # 在推理线程中调用，nogil 让界面线程在计算期间不被 GIL 阻塞
+    return numba.njit(cache=True, nogil=True)(_centroids_areas_loop)
 
-def point_in_polygon(point: Tuple[float, float], polygon: List[Tuple[float, float]]) -> bool:
+
+def polygon_centroids_areas(polygons) -> Tuple[np.ndarray, np.ndarray]:
     """
-    判断点是否在多边形内（射线法）
+    批量计算多个多边形的顶点中心和面积
+    
+    所有顶点拼成一个连续的 (V, 2) 数组加偏移量，用 NumPy 按段归约一次处理全部多边形；
+    总顶点数超过 CENTROIDS_JIT_MIN_VERTICES 且安装了 numba 时改用 JIT 内核
+    
+    Args:
+        polygons: 多边形列表，每个为顶点坐标列表或 (N, 2) 数组（N >= 1）
+        
+    Returns:
+        (centroids, areas)：形状为 (M, 2) 的顶点均值和长度为 M 的面积（鞋带公式）
+    """
+    count = len(polygons)
+    centroids = np.empty((count, 2), dtype=np.float64)
+    areas = np.empty(count, dtype=np.float64)
+    if count == 0:
+        return centroids, areas
+    
+    arrays = [np.asarray(p, dtype=np.float64).reshape(-1, 2) for p in polygons]
+    xys = np.concatenate(arrays)
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum([len(a) for a in arrays], out=offsets[1:])
+    
+    if len(xys) >= CENTROIDS_JIT_MIN_VERTICES:
+        centroids_areas = _centroids_areas_kernel()
+        if centroids_areas is not None:
+            centroids_areas(xys, offsets, centroids, areas)
+            return centroids, areas
+    
+    # 按段归约
+    starts = offsets[:-1]
+    centroids[:] = np.add.reduceat(xys, starts, axis=0) / np.diff(offsets)[:, None]
+    nxt = np.arange(1, len(xys) + 1)
+    nxt[offsets[1:] - 1] = starts  # 每段最后一个顶点与该段第一个顶点闭合
+    cross = xys[:, 0] * xys[nxt, 1] - xys[nxt, 0] * xys[:, 1]
+    areas[:] = np.abs(np.add.reduceat(cross, starts)) / 2.0
+    return centroids, areas
+
+
+def _pnpoly_batch_loop(xs, ys, poly_x, poly_y, out):
+    """射线法逐点判断点集是否在多边形内，结果写入 out（顶点按 x、y 分开存放的连续数组）"""
+    n = poly_x.shape[0]
+    for k in range(xs.shape[0]):
+        x = xs[k]
+        y = ys[k]
+        inside = False
+        j = n - 1
+        for i in range(n):
+            yi = poly_y[i]
+            yj = poly_y[j]
+            if (yj < y) != (yi < y):
+                x_inters = (y - yj) * (poly_x[i] - poly_x[j]) / (yi - yj) + poly_x[j]
+                if x <= x_inters:
+                    inside = not inside
+            j = i
+        out[k] = inside
+
+
+@lru_cache(maxsize=None)
+def _pnpoly_batch_kernel():
+    """numba 编译的 _pnpoly_batch_loop（首次调用时才导入 numba）；未安装时返回 None"""
+    numba = _numba()
+    if numba is None:
+        return None
+    return numba.njit(cache=True, fastmath=True, nogil=True)(_pnpoly_batch_loop)
+
+
+def point_in_polygon(point, polygon: List[Tuple[float, float]]):
+    """
+    判断点是否在多边形内（射线法，默认 NumPy 向量化；
+    点集规模超过 PNPOLY_JIT_MIN_WORK 且安装了 numba 时改用 JIT 内核，避免巨大的临时数组）
     
     Args:
-        point: 测试点坐标
+        point: 测试点坐标 (x, y)，或形状为 (M, 2) 的点集
         polygon: 多边形顶点坐标列表
         
     Returns:
-        点是否在多边形内
+        单个点时返回 bool；点集时返回长度为 M 的布尔数组
     """
-    x, y = point
-    n = len(polygon)
-    inside = False
+    poly = np.asarray(polygon, dtype=np.float64)
+    pts = np.asarray(point, dtype=np.float64)
+    single = pts.ndim == 1
+    pts = pts.reshape(-1, 2)
     
-    p1x, p1y = polygon[0]
-    for i in range(1, n + 1):
-        p2x, p2y = polygon[i % n]
-        
-        if y > min(p1y, p2y):
-            if y <= max(p1y, p2y):
-                if x <= max(p1x, p2x):
-                    if p1y != p2y:
-                        xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                    if p1x == p2x or x <= xinters:
-                        inside = not inside
-        
-        p1x, p1y = p2x, p2y
+    if not single and len(pts) * len(poly) >= PNPOLY_JIT_MIN_WORK:
+        pnpoly_batch = _pnpoly_batch_kernel()
+        if pnpoly_batch is not None:
+            out = np.empty(len(pts), dtype=np.bool_)
+            pnpoly_batch(np.ascontiguousarray(pts[:, 0]), np.ascontiguousarray(pts[:, 1]),
+                         np.ascontiguousarray(poly[:, 0]), np.ascontiguousarray(poly[:, 1]), out)
+            return out
+    
+    # 每条边的起点 p1 和终点 p2（含首尾闭合边）
+    p1 = poly
+    p2 = np.roll(poly, -1, axis=0)
+    x = pts[:, 0:1]
+    y = pts[:, 1:2]
     
-    return inside
+    # 射线与边相交：y 落在 (min(p1y, p2y), max(p1y, p2y)] 内，且交点在测试点右侧
+    dy = p2[:, 1] - p1[:, 1]
+    crosses = (p1[:, 1] < y) != (p2[:, 1] < y)
+    x_inters = (y - p1[:, 1]) * (p2[:, 0] - p1[:, 0]) / np.where(dy == 0, 1.0, dy) + p1[:, 0]
+    inside = np.logical_xor.reduce(crosses & (x <= x_inters), axis=1)
+    
+    return bool(inside[0]) if single else inside
 
 
 def simplify_polygon(points: List[Tuple[float, float]], tolerance: float = 2.0) -> List[Tuple[float, float]]:
@@ -199,46 +625,39 @@ def simplify_polygon(points: List[Tuple[float, float]], tolerance: float = 2.0)
     Returns:
         简化后的顶点列表
     """
-    if len(points) <= 2:
+    n = len(points)
+    if n <= 2:
         return points
     
-    def perpendicular_distance(point, line_start, line_end):
-        """计算点到直线的垂直距离"""
-        if line_start == line_end:
-            return ((point[0] - line_start[0]) ** 2 + (point[1] - line_start[1]) ** 2) ** 0.5
-        
-        A = line_end[1] - line_start[1]
-        B = line_start[0] - line_end[0]
-        C = line_end[0] * line_start[1] - line_start[0] * line_end[1]
-        
-        return abs(A * point[0] + B * point[1] + C) / (A ** 2 + B ** 2) ** 0.5
-    
-    def douglas_peucker(points_list, epsilon):
-        """递归简化"""
-        if len(points_list) <= 2:
-            return points_list
-        
-        # 找到距离最大的点
-        max_distance = 0
-        index = 0
-        end = len(points_list) - 1
-        
-        for i in range(1, end):
-            distance = perpendicular_distance(points_list[i], points_list[0], points_list[end])
-            if distance > max_distance:
-                index = i
-                max_distance = distance
-        
-        # 如果最大距离大于阈值，递归简化
-        if max_distance > epsilon:
-            left = douglas_peucker(points_list[:index + 1], epsilon)
-            right = douglas_peucker(points_list[index:], epsilon)
-            
-            return left[:-1] + right
+    pts = np.asarray(points, dtype=np.float64)
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    
+    # 用显式栈代替递归，每段内所有点到端点连线的距离一次性向量化计算
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        
+        seg = pts[end] - pts[start]
+        rel = pts[start + 1:end] - pts[start]
+        seg_len = np.hypot(seg[0], seg[1])
+        if seg_len == 0:
+            # 端点重合时退化为到端点的距离
+            distances = np.hypot(rel[:, 0], rel[:, 1])
         else:
-            return [points_list[0], points_list[end]]
+            distances = np.abs(seg[0] * rel[:, 1] - seg[1] * rel[:, 0]) * (1.0 / seg_len)
+        
+        # 找到距离最大的点，大于阈值则保留并继续细分
+        offset = int(distances.argmax())
+        if distances[offset] > tolerance:
+            index = start + 1 + offset
+            keep[index] = True
+            stack.append((start, index))
+            stack.append((index, end))
     
-    return douglas_peucker(points, tolerance)
+    return [points[i] for i in np.flatnonzero(keep)]
 
 
 def process_regions_for_model(regions: List[Dict], image_size: Tuple[int, int]) -> List[Dict]:
@@ -246,7 +665,7 @@ def process_regions_for_model(regions: List[Dict], image_size: Tuple[int, int])
     为模型处理区域信息
     
     Args:
-        regions: 区域信息列表
+        regions: 区域信息列表（可带 'points_array' 顶点数组，仅内部复用，不会出现在结果中）
         image_size: 图像尺寸
         
     Returns:
@@ -254,29 +673,38 @@ def process_regions_for_model(regions: List[Dict], image_size: Tuple[int, int])
     """
     processed_regions = []
     
+    valid = []
     for region in regions:
         if 'points' not in region or len(region['points']) < 3:
             continue
-        
+        pts = region.get('points_array')
+        if pts is None:
+            pts = np.asarray(region['points'], dtype=np.float64)
+        valid.append((region, pts))
+    
+    # 所有区域的中心点和面积一次批量计算
+    centroids, areas = polygon_centroids_areas([pts for _, pts in valid])
+    
+    for k, (region, pts) in enumerate(valid):
         points = region['points']
         
         # 计算区域属性
-        area = calculate_polygon_area(points)
+        area = float(areas[k])
         
-        # 计算边界框
-        xs = [p[0] for p in points]
-        ys = [p[1] for p in points]
+        # 计算边界框（一次性对整个点数组做归约）
+        x_min, y_min = pts.min(axis=0).tolist()
+        x_max, y_max = pts.max(axis=0).tolist()
         bbox = {
-            'x_min': min(xs),
-            'y_min': min(ys),
-            'x_max': max(xs),
-            'y_max': max(ys)
+            'x_min': x_min,
+            'y_min': y_min,
+            'x_max': x_max,
+            'y_max': y_max
         }
         
-        # 计算中心点
+        center_x, center_y = centroids[k].tolist()
         center = {
-            'x': sum(xs) / len(xs),
-            'y': sum(ys) / len(ys)
+            'x': center_x,
+            'y': center_y
         }
         
         # 相对位置（相对于图像大小）
@@ -314,8 +742,8 @@ def extract_image_features(image: Image.Image) -> Dict[str, Any]:
     Returns:
         图像特征字典
     """
-    # 转换为numpy数组
-    img_array = np.array(image)
+    # 转换为numpy数组（只读视图即可，无需拷贝）
+    img_array = np.asarray(image)
     
     features = {
         'size': image.size,
@@ -324,18 +752,34 @@ def extract_image_features(image: Image.Image) -> Dict[str, Any]:
         'has_transparency': image.mode in ('RGBA', 'LA') or 'transparency' in image.info
     }
     
+    if cv2 is not None and img_array.dtype in (np.uint8, np.uint16, np.float32):
+        # OpenCV 一次遍历同时得到各通道均值和标准差
+        mean, std = cv2.meanStdDev(img_array)
+        mean = mean.ravel()
+        std = std.ravel()
+        # 由各通道结果推出整体均值/标准差：Var = E[X²] - E[X]²
+        brightness = float(mean.mean())
+        contrast = float(np.sqrt(max(np.mean(std ** 2 + mean ** 2) - brightness ** 2, 0.0)))
+    else:
+        mean = std = None
+        brightness = float(np.mean(img_array))
+        contrast = float(np.std(img_array))
+    
     if len(img_array.shape) == 3:  # 彩色图像
         # 计算颜色统计
+        if mean is None:
+            mean = np.mean(img_array, axis=(0, 1))
+            std = np.std(img_array, axis=(0, 1))
         features.update({
-            'mean_rgb': np.mean(img_array, axis=(0, 1)).tolist(),
-            'std_rgb': np.std(img_array, axis=(0, 1)).tolist(),
-            'brightness': np.mean(img_array),
-            'contrast': np.std(img_array)
+            'mean_rgb': mean.tolist(),
+            'std_rgb': std.tolist(),
+            'brightness': brightness,
+            'contrast': contrast
         })
     else:  # 灰度图像
         features.update({
-            'brightness': np.mean(img_array),
-            'contrast': np.std(img_array)
+            'brightness': brightness,
+            'contrast': contrast
         })
     
     return features
@@ -356,8 +800,9 @@ def save_config(config: Dict[str, Any], file_path: str) -> bool:
         # 确保目录存在
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        # 以二进制写入 UTF-8 字节，省去文本模式的编码和换行转换
+        with open(file_path, 'wb') as f:
+            f.write(_json_dumps(config, indent=True))
         
         return True
         
@@ -378,8 +823,8 @@ def load_config(file_path: str, default_config: Dict[str, Any] = None) -> Dict[s
         配置字典
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        with open(file_path, 'rb') as f:
+            config = _json_loads(f.read())
         
         # 如果有默认配置，合并配置
         if default_config:
@@ -408,7 +853,8 @@ def create_thumbnail(image: Image.Image, size: Tuple[int, int] = (200, 200)) ->
         缩略图
     """
     thumbnail = image.copy()
-    thumbnail.thumbnail(size, Image.Resampling.LANCZOS)
+    # 缩略图不需要 LANCZOS 的画质，双线性插值快得多
+    thumbnail.thumbnail(size, Image.Resampling.BILINEAR)
     return thumbnail
 
 
@@ -424,13 +870,25 @@ def blend_images(base_image: Image.Image, overlay_image: Image.Image, alpha: flo
     Returns:
         混合后的图像
     """
-    if base_image.size != overlay_image.size:
-        overlay_image = overlay_image.resize(base_image.size, Image.Resampling.LANCZOS)
-    
     if base_image.mode != overlay_image.mode:
         overlay_image = overlay_image.convert(base_image.mode)
     
-    return Image.blend(base_image, overlay_image, alpha)
+    if cv2 is None or base_image.mode not in ('L', 'RGB', 'RGBA'):
+        # 其他模式（或未安装 OpenCV）交给 PIL 处理
+        if base_image.size != overlay_image.size:
+            overlay_image = overlay_image.resize(base_image.size, Image.Resampling.BILINEAR)
+        return Image.blend(base_image, overlay_image, alpha)
+    
+    base_arr = np.asarray(base_image)
+    overlay_arr = np.asarray(overlay_image)
+    if base_image.size != overlay_image.size:
+        # 界面叠加层用双线性插值即可，比 LANCZOS 快得多
+        overlay_arr = cv2.resize(overlay_arr, base_image.size, interpolation=cv2.INTER_LINEAR)
+    
+    # cv2.addWeighted 使用 SIMD 直接写入预分配的输出数组
+    dst = np.empty_like(base_arr)
+    cv2.addWeighted(base_arr, 1.0 - alpha, overlay_arr, alpha, 0.0, dst=dst)
+    return Image.fromarray(dst)
 
 
 def apply_image_filter(image: Image.Image, filter_type: str) -> Image.Image:
@@ -459,6 +917,54 @@ def apply_image_filter(image: Image.Image, filter_type: str) -> Image.Image:
     return image
 
 
+# 错误日志由后台线程统一写入，避免每次记录都打开/关闭文件
+_LOG_FILE_PATH = "logs/error.log"
+_LOG_BATCH_SIZE = 64
+_log_queue: "queue.Queue[str]" = queue.Queue()
+_log_thread: Optional[threading.Thread] = None
+_log_thread_lock = threading.Lock()
+
+
+def _drain_log_queue() -> None:
+    """后台线程：只打开一次日志文件，按批写入队列中的日志"""
+    try:
+        os.makedirs(os.path.dirname(_LOG_FILE_PATH), exist_ok=True)
+        f = open(_LOG_FILE_PATH, "a", encoding="utf-8")
+    except Exception:
+        f = None  # 日志文件不可用时仍需消费队列
+    
+    while True:
+        lines = [_log_queue.get()]
+        while len(lines) < _LOG_BATCH_SIZE:
+            try:
+                lines.append(_log_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        try:
+            if f is not None:
+                f.write("\n".join(lines) + "\n")
+                f.flush()
+        except Exception:
+            pass  # 忽略日志写入错误
+        finally:
+            for _ in lines:
+                _log_queue.task_done()
+
+
+def _ensure_log_thread() -> None:
+    """首次记录日志时启动后台写入线程"""
+    global _log_thread
+    if _log_thread is not None:
+        return
+    with _log_thread_lock:
+        if _log_thread is None:
+            _log_thread = threading.Thread(target=_drain_log_queue, name="error-log-writer", daemon=True)
+            _log_thread.start()
+            # 退出前等待队列中剩余的日志写完
+            atexit.register(_log_queue.join)
+
+
 def log_error(error_msg: str, error_type: str = "ERROR") -> None:
     """
     记录错误日志
@@ -467,18 +973,12 @@ def log_error(error_msg: str, error_type: str = "ERROR") -> None:
         error_msg: 错误消息
         error_type: 错误类型
     """
-    import datetime
-    
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     log_msg = f"[{timestamp}] {error_type}: {error_msg}"
     
     # 输出到控制台
     print(log_msg)
     
-    # 可以添加文件日志记录
-    try:
-        os.makedirs("logs", exist_ok=True)
-        with open("logs/error.log", "a", encoding="utf-8") as f:
-            f.write(log_msg + "\n")
-    except Exception:
-        pass  # 忽略日志写入错误
\ No newline at end of file
+    # 交给后台线程写入文件
+    _ensure_log_thread()
+    _log_queue.put_nowait(log_msg)
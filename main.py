@@ -7,52 +7,59 @@
 
 import sys, platform
 from pathlib import Path
-import os
 from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QIcon, QFont
+from PyQt5.QtGui import QIcon, QFont, QPixmapCache
 from PyQt5 import QtCore, QtWidgets
 from ui.main_window import MainWindow
+from ui.chat_widget import AvatarLabel
+
+# 样式文件路径，按 main.py 所在目录解析，不依赖当前工作目录
+_BASE_DIR = Path(__file__).parent
+_STYLE_PATHS = (_BASE_DIR / "styles.css", _BASE_DIR / "resources" / "styles.qss")
+
+
+# QPixmapCache 容量（KB）
+PIXMAP_CACHE_LIMIT_KB = 20 * 1024
+
 
 def load_styles(app):
-    qss_path = Path(__file__).with_name("styles.css")  # 确保 styles.css 和 main.py 同目录
-    if qss_path.exists():
-        app.setStyleSheet(qss_path.read_text(encoding="utf-8"))
+    """合并所有存在的样式文件，只调用一次 setStyleSheet"""
+    qss = "".join(path.read_text(encoding="utf-8") for path in _STYLE_PATHS if path.exists())
+    if qss:
+        app.setStyleSheet(qss)
     else:
         print("未找到样式文件，使用默认样式")
 
 def main():
     """主函数"""
-    # 创建应用程序
-
+    # 启用高DPI支持（必须在创建 QApplication 之前设置）
     QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling, True)
     QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps, True)
+
+    # 创建应用程序
     app = QApplication(sys.argv)
+
+    # 设置全局字体
     family = "PingFang SC" if platform.system() == "Darwin" else "Microsoft YaHei"
     app.setFont(QFont(family, 10))
+
+    # 加载全局样式
     load_styles(app)
+
+    # 全局 QPixmap 缓存上限（单位 KB），超出后按 LRU 淘汰
+    QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
+
     app.setApplicationName("农业视觉问答助手")
     app.setApplicationVersion("1.0.0")
     app.setOrganizationName("农业AI实验室")
 
     # 设置应用程序图标
-    if os.path.exists("resources/icons/app_icon.png"):
-        app.setWindowIcon(QIcon("resources/icons/app_icon.png"))
+    icon_path = _BASE_DIR / "resources" / "icons" / "app_icon.png"
+    if icon_path.exists():
+        app.setWindowIcon(QIcon(str(icon_path)))
 
-    # 设置全局字体
-    font = QFont("Microsoft YaHei", 10)
-    app.setFont(font)
-
-    # 启用高DPI支持
-    app.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    app.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
-
-    # 加载全局样式
-    try:
-        with open("resources/styles.qss", "r", encoding="utf-8") as f:
-            app.setStyleSheet(f.read())
-    except FileNotFoundError:
-        print("未找到样式文件，使用默认样式")
+    # 预加载头像，避免首条消息时再解码绘制
+    AvatarLabel.preload()
 
     # 创建主窗口
     window = MainWindow()
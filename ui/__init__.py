@@ -2,13 +2,20 @@
 # -*- coding: utf-8 -*-
 """
 UI模块初始化文件
+
+各控件按需导入（PEP 562），导入 ui 包时不会加载全部子模块
 """
 
-from .main_window import MainWindow
-from .image_widget import ImageWidget
-from .drawing_widget import RegionDrawingWidget
-from .question_widget import QuestionInputWidget
-from .chat_widget import ChatHistoryWidget
+import importlib
+
+# 导出名称 -> 所在子模块
+_LAZY_IMPORTS = {
+    'MainWindow': 'main_window',
+    'ImageWidget': 'image_widget',
+    'RegionDrawingWidget': 'drawing_widget',
+    'QuestionInputWidget': 'question_widget',
+    'ChatHistoryWidget': 'chat_widget',
+}
 
 __all__ = [
     'MainWindow',
@@ -16,4 +23,18 @@ __all__ = [
     'RegionDrawingWidget',
     'QuestionInputWidget',
     'ChatHistoryWidget'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{module_name}', __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj  # 缓存，之后直接命中模块属性
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
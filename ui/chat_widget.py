@@ -8,10 +8,46 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QScrollArea, 
                            QLabel, QFrame, QPushButton, QTextEdit, QSizePolicy)
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QPropertyAnimation, QEasingCurve
-from PyQt5.QtGui import QFont, QPixmap, QPainter, QPainterPath, QColor, QBrush
+from PyQt5.QtGui import QFont, QPixmap, QPixmapCache, QPainter, QPainterPath, QColor, QBrush
 import datetime
 import os
 
+from .fonts import get_font
+
+
+# 消息气泡样式（模块级常量，避免每条消息重复构造）
+_USER_BUBBLE_QSS = """
+    QFrame {
+        background-color: #4CAF50;
+        border-radius: 15px;
+        margin: 5px;
+        padding: 10px;
+    }
+"""
+_AI_BUBBLE_QSS = """
+    QFrame {
+        background-color: #f1f1f1;
+        border-radius: 15px;
+        margin: 5px;
+        padding: 10px;
+    }
+"""
+_USER_MSG_QSS = "color: white; line-height: 1.4;"
+_AI_MSG_QSS = "color: #333; line-height: 1.4;"
+_USER_TIME_QSS = "color: rgba(255, 255, 255, 0.8);"
+_AI_TIME_QSS = "color: #888;"
+_DOT_QSS = "color: #888; font-size: 16px;"
+_DOT_ACTIVE_QSS = "color: #4CAF50; font-size: 16px;"
+
+
+def _load_pixmap(path):
+    """从文件加载 QPixmap，解码结果放入全局 QPixmapCache 复用"""
+    pixmap = QPixmapCache.find(path)
+    if pixmap is None or pixmap.isNull():
+        pixmap = QPixmap(path)
+        QPixmapCache.insert(path, pixmap)
+    return pixmap
+
 
 class MessageBubble(QFrame):
     """消息气泡组件"""
@@ -28,24 +64,7 @@ class MessageBubble(QFrame):
         self.setMaximumWidth(600)
         
         # 设置气泡样式
-        if self.is_user:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #4CAF50;
-                    border-radius: 15px;
-                    margin: 5px;
-                    padding: 10px;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #f1f1f1;
-                    border-radius: 15px;
-                    margin: 5px;
-                    padding: 10px;
-                }
-            """)
+        self.setStyleSheet(_USER_BUBBLE_QSS if self.is_user else _AI_BUBBLE_QSS)
         
         layout = QVBoxLayout()
         layout.setContentsMargins(15, 10, 15, 10)
@@ -56,25 +75,20 @@ class MessageBubble(QFrame):
         message_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
         
         # 设置字体和颜色
-        font = QFont("Microsoft YaHei", 11)
-        message_label.setFont(font)
-        
-        if self.is_user:
-            message_label.setStyleSheet("color: white; line-height: 1.4;")
-        else:
-            message_label.setStyleSheet("color: #333; line-height: 1.4;")
+        message_label.setFont(get_font(11))
+        message_label.setStyleSheet(_USER_MSG_QSS if self.is_user else _AI_MSG_QSS)
         
         layout.addWidget(message_label)
         
         # 时间戳
         time_label = QLabel(self.timestamp.strftime("%H:%M"))
-        time_label.setFont(QFont("Microsoft YaHei", 9))
+        time_label.setFont(get_font(9))
         
         if self.is_user:
-            time_label.setStyleSheet("color: rgba(255, 255, 255, 0.8);")
+            time_label.setStyleSheet(_USER_TIME_QSS)
             time_label.setAlignment(Qt.AlignRight)
         else:
-            time_label.setStyleSheet("color: #888;")
+            time_label.setStyleSheet(_AI_TIME_QSS)
             time_label.setAlignment(Qt.AlignLeft)
         
         layout.addWidget(time_label)
@@ -85,14 +99,29 @@ class MessageBubble(QFrame):
 class AvatarLabel(QLabel):
     """头像标签"""
     
+    # 已生成的圆形头像，键为 (is_user, 宽, 高)，所有消息共享
+    _cache = {}
+    
     def __init__(self, is_user=True):
         super().__init__()
         self.is_user = is_user
         self.setFixedSize(40, 40)
         self.load_avatar()
     
+    @classmethod
+    def preload(cls):
+        """预先生成用户和助手头像"""
+        cls(True)
+        cls(False)
+    
     def load_avatar(self):
         """加载头像"""
+        key = (self.is_user, self.width(), self.height())
+        cached = AvatarLabel._cache.get(key)
+        if cached is not None:
+            self.setPixmap(cached)
+            return
+        
         if self.is_user:
             avatar_path = "resources/avatars/user.png"
             default_color = QColor(52, 152, 219)  # 蓝色
@@ -103,12 +132,15 @@ class AvatarLabel(QLabel):
             text = "AI"
         
         if os.path.exists(avatar_path):
-            pixmap = QPixmap(avatar_path)
+            pixmap = _load_pixmap(avatar_path)
             # 创建圆形头像
             self.setPixmap(self.create_circular_pixmap(pixmap))
         else:
             # 使用默认头像
             self.create_default_avatar(default_color, text)
+        
+        # QLabel.pixmap() 返回的是标签内部对象，需复制一份（隐式共享，开销很小）
+        AvatarLabel._cache[key] = QPixmap(self.pixmap())
     
     def create_circular_pixmap(self, pixmap):
         """创建圆形头像"""
@@ -150,7 +182,7 @@ class AvatarLabel(QLabel):
         
         # 绘制文字
         painter.setPen(QColor(255, 255, 255))
-        font = QFont("Microsoft YaHei", 12, QFont.Bold)
+        font = get_font(12, QFont.Bold)
         painter.setFont(font)
         painter.drawText(self.rect(), Qt.AlignCenter, text)
         painter.end()
@@ -236,7 +268,7 @@ class TypingIndicator(QWidget):
         self.dots = []
         for i in range(3):
             dot = QLabel("●")
-            dot.setStyleSheet("color: #888; font-size: 16px;")
+            dot.setStyleSheet(_DOT_QSS)
             dot.setAlignment(Qt.AlignCenter)
             self.dots.append(dot)
             typing_layout.addWidget(dot)
@@ -252,6 +284,7 @@ class TypingIndicator(QWidget):
         self.timer = QTimer()
         self.timer.timeout.connect(self.animate_dots)
         self.animation_step = 0
+        self._active_dot = None  # 当前高亮的点，None 表示全部为灰色
     
     def start_animation(self):
         """开始动画"""
@@ -260,21 +293,25 @@ class TypingIndicator(QWidget):
     def stop_animation(self):
         """停止动画"""
         self.timer.stop()
-        # 重置所有点的颜色
-        for dot in self.dots:
-            dot.setStyleSheet("color: #888; font-size: 16px;")
+        # 重置高亮的点
+        self._set_active_dot(None)
     
     def animate_dots(self):
         """动画效果"""
-        # 重置所有点
-        for dot in self.dots:
-            dot.setStyleSheet("color: #888; font-size: 16px;")
-        
-        # 高亮当前点
-        if self.animation_step < len(self.dots):
-            self.dots[self.animation_step].setStyleSheet("color: #4CAF50; font-size: 16px;")
-        
-        self.animation_step = (self.animation_step + 1) % (len(self.dots) + 1)
+        # 高亮当前点，最后一帧全部为灰色
+        step = self.animation_step
+        self._set_active_dot(step if step < len(self.dots) else None)
+        self.animation_step = (step + 1) % (len(self.dots) + 1)
+    
+    def _set_active_dot(self, index):
+        """切换高亮点，只重设样式发生变化的点，避免每帧重新解析全部样式表"""
+        if index == self._active_dot:
+            return
+        if self._active_dot is not None:
+            self.dots[self._active_dot].setStyleSheet(_DOT_QSS)
+        if index is not None:
+            self.dots[index].setStyleSheet(_DOT_ACTIVE_QSS)
+        self._active_dot = index
 
 
 class ChatHistoryWidget(QWidget):
@@ -282,7 +319,11 @@ class ChatHistoryWidget(QWidget):
     
     def __init__(self):
         super().__init__()
-        self.messages = []
+        # 消息按字段分列存储（同一下标对应同一条消息）
+        self._texts = []
+        self._is_user = []
+        self._timestamps = []
+        self._widgets = []
         self.typing_indicator = None
         self.init_ui()
     
@@ -310,7 +351,7 @@ class ChatHistoryWidget(QWidget):
         
         # 标题
         title = QLabel("对话历史")
-        title.setFont(QFont("Microsoft YaHei", 12, QFont.Bold))
+        title.setFont(get_font(12, QFont.Bold))
         layout.addWidget(title)
         
         layout.addStretch()
@@ -373,12 +414,14 @@ class ChatHistoryWidget(QWidget):
         
         container = MessageContainer(welcome_text, False)
         self.messages_layout.addWidget(container)
-        self.messages.append({
-            'text': welcome_text,
-            'is_user': False,
-            'timestamp': datetime.datetime.now(),
-            'widget': container
-        })
+        self._append_message(welcome_text, False, datetime.datetime.now(), container)
+    
+    def _append_message(self, text, is_user, timestamp, widget):
+        """保存消息"""
+        self._texts.append(text)
+        self._is_user.append(is_user)
+        self._timestamps.append(timestamp)
+        self._widgets.append(widget)
     
     def add_user_message(self, message):
         """添加用户消息"""
@@ -397,12 +440,7 @@ class ChatHistoryWidget(QWidget):
         self.messages_layout.addStretch()
         
         # 保存消息
-        self.messages.append({
-            'text': message,
-            'is_user': True,
-            'timestamp': timestamp,
-            'widget': container
-        })
+        self._append_message(message, True, timestamp, container)
         
         # 滚动到底部
         QTimer.singleShot(50, self.scroll_to_bottom)
@@ -427,12 +465,7 @@ class ChatHistoryWidget(QWidget):
         self.messages_layout.addStretch()
         
         # 保存消息
-        self.messages.append({
-            'text': message,
-            'is_user': False,
-            'timestamp': timestamp,
-            'widget': container
-        })
+        self._append_message(message, False, timestamp, container)
         
         # 滚动到底部
         QTimer.singleShot(50, self.scroll_to_bottom)
@@ -472,12 +505,15 @@ class ChatHistoryWidget(QWidget):
     def clear_history(self):
         """清空对话历史"""
         # 清空消息列表
-        for message in self.messages:
-            if message['widget']:
-                self.messages_layout.removeWidget(message['widget'])
-                message['widget'].deleteLater()
+        for widget in self._widgets:
+            if widget:
+                self.messages_layout.removeWidget(widget)
+                widget.deleteLater()
         
-        self.messages.clear()
+        self._texts.clear()
+        self._is_user.clear()
+        self._timestamps.clear()
+        self._widgets.clear()
         
         # 移除打字指示器
         self.remove_typing_indicator()
@@ -492,14 +528,11 @@ class ChatHistoryWidget(QWidget):
     
     def get_message_count(self):
         """获取消息数量"""
-        return len(self.messages)
+        return len(self._texts)
     
     def export_history(self):
         """导出对话历史"""
-        history_text = []
-        for message in self.messages:
-            timestamp = message['timestamp'].strftime("%Y-%m-%d %H:%M:%S")
-            sender = "用户" if message['is_user'] else "助手"
-            history_text.append(f"[{timestamp}] {sender}: {message['text']}")
-        
-        return "\n\n".join(history_text)
\ No newline at end of file
+        return "\n\n".join(
+            f"[{timestamp:%Y-%m-%d %H:%M:%S}] {'用户' if is_user else '助手'}: {text}"
+            for timestamp, is_user, text in zip(self._timestamps, self._is_user, self._texts)
+        )
\ No newline at end of file
@@ -9,13 +9,14 @@ from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QListWidget, QListWidgetItem, QFrame, QScrollArea, QMessageBox, QCheckBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QPoint
+from PyQt5.QtCore import Qt, pyqtSignal, QPoint, QLine, QRect, QTimer
 from PyQt5.QtGui import (
-    QPainter, QPen, QColor, QBrush, QPolygon, QCursor, QFont, QPixmap
+    QPainter, QPen, QColor, QBrush, QCursor, QFont, QPixmap, QRegion
 )
 import numpy as np
 from PIL import Image
 from core.utils import create_polygon_mask
+from core.qt_np import ndarray_to_qimage, ndarray_to_qpolygonf
 
 
 class DrawingArea(QLabel):
@@ -23,14 +24,28 @@ class DrawingArea(QLabel):
 
     region_added = pyqtSignal(list)  # 新区域添加信号
 
+    # 局部重绘时包围盒外扩的像素（覆盖线宽、顶点圆点和区域编号圆）
+    _POINT_MARGIN = 8
+    _REGION_MARGIN = 18
+
+    # 合并重绘请求的间隔（毫秒），约一帧
+    _REPAINT_INTERVAL_MS = 16
+
+    # 当前多边形顶点缓冲区的初始容量，不够时翻倍
+    _INITIAL_CAPACITY = 16
+
     def __init__(self):
         super().__init__()
         self.image = None              # PIL.Image
-        self.base_pixmap = None        # 原始图像 QPixmap（不含标注）
-        self.pixmap = None             # 叠加标注后的 QPixmap（原始大小）
+        self.base_pixmap = None        # 原始图像 QPixmap（不含标注），标注在 paintEvent 中叠加
+        self._img_buf = None           # base_pixmap 对应的像素缓冲区
 
+        # 已完成区域：{'points': 顶点列表, 'centroid': (cx, cy), 'qpolygon': QPolygonF, 'qlines': 闭合边}
+        # 质心和 QPolygonF 在区域创建时计算一次，重绘时直接复用
         self.regions = []
-        self.current_polygon = []
+        # 正在绘制的多边形：预分配的 (capacity, 2) 顶点缓冲区 + 有效长度
+        self._current_buf = np.empty((self._INITIAL_CAPACITY, 2), dtype=np.float64)
+        self._current_len = 0
         self.is_drawing = False
 
         # 左上对齐，方便与 QScrollArea 搭配，坐标换算更简单
@@ -52,87 +67,123 @@ class DrawingArea(QLabel):
             }
         """)
 
+        # 高频输入（连续加点、预览）时累积脏区域，每帧最多提交一次重绘
+        self._pending_dirty = QRegion()
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(self._REPAINT_INTERVAL_MS)
+        self._repaint_timer.timeout.connect(self._flush_pending_update)
+
+    @property
+    def current_polygon(self):
+        """正在绘制的多边形顶点，(n, 2) 数组视图"""
+        return self._current_buf[:self._current_len]
+
     def set_image(self, pil_image: Image.Image):
         """设置要绘制的图像"""
         self.image = pil_image
-        self.update_display()
+        self._rebuild_base_pixmap()
         self.clear_current_polygon()
+        self.update_display()
 
-    def update_display(self):
+    def _rebuild_base_pixmap(self):
+        """PIL -> QPixmap（原始尺寸），只在更换图像时执行一次"""
         if self.image is None:
+            self.base_pixmap = None
+            self._img_buf = None
+            return
+        # 保留数组引用，保证 QImage 使用期间底层缓冲区不被释放
+        self._img_buf = np.asarray(self.image)
+        self.base_pixmap = QPixmap.fromImage(ndarray_to_qimage(self._img_buf))
+
+    def update_display(self):
+        if self.image is None or self.base_pixmap is None:
             self.setText("请先加载图像")
         else:
-            # PIL -> QPixmap（原始尺寸）
-            img_array = np.array(self.image)
-            h, w, _ = img_array.shape
-            from PyQt5.QtGui import QImage
-            qimg = QImage(img_array.data, w, h, 3 * w, QImage.Format_RGB888)
-            self.base_pixmap = QPixmap.fromImage(qimg)
-
-            # 在副本上画区域（原始尺寸）
-            self.pixmap = self.base_pixmap.copy()
-            self._draw_regions_on_pixmap()
-
+            # 底图只设置一次，区域由 paintEvent 叠加绘制
             # 不做缩放：label 固定为图像大小，ScrollArea 负责滚动
-            self.setPixmap(self.pixmap)
-            self.setFixedSize(self.pixmap.size())
-
-    def _draw_regions_on_pixmap(self):
-        """在QPixmap上绘制所有区域"""
-        if self.pixmap is None:
+            if self.pixmap() is None or self.pixmap().cacheKey() != self.base_pixmap.cacheKey():
+                self.setPixmap(self.base_pixmap)
+                self.setFixedSize(self.base_pixmap.size())
+            self.update()
+
+    def paintEvent(self, event):
+        """先由 QLabel 绘制底图，再在其上叠加区域"""
+        super().paintEvent(event)
+        if self.base_pixmap is None or (not self.regions and self._current_len == 0):
             return
-        painter = QPainter(self.pixmap)
+        painter = QPainter(self)
+        painter.setClipRect(event.rect() & self.contentsRect())
+        # 与 QLabel 绘制底图的位置对齐（内容区左上角）
+        painter.translate(self.contentsRect().topLeft())
+        self._draw_regions(painter)
+        painter.end()
+
+    def _dirty_rect(self, points, margin):
+        """多边形包围盒（控件坐标），向外扩展 margin 像素"""
+        arr = np.asarray(points)
+        x0, y0 = arr.min(axis=0)
+        x1, y1 = arr.max(axis=0)
+        rect = QRect(int(x0) - margin, int(y0) - margin,
+                     int(x1 - x0) + 2 * margin + 1,
+                     int(y1 - y0) + 2 * margin + 1)
+        return rect.translated(self.contentsRect().topLeft())
+
+    def _schedule_update(self, rect):
+        """累积脏区域，由定时器合并成一次重绘"""
+        self._pending_dirty += rect
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+
+    def _flush_pending_update(self):
+        if not self._pending_dirty.isEmpty():
+            self.update(self._pending_dirty)
+            self._pending_dirty = QRegion()
+
+    def _draw_regions(self, painter):
+        """用给定的 painter 绘制所有区域"""
         painter.setRenderHint(QPainter.Antialiasing)
 
         # 已完成区域（填充更实一些）
         for i, region in enumerate(self.regions):
-            if len(region) >= 3:
-                self._draw_polygon(painter, region, self.region_color, i + 1)
-
-        # 正在绘制的边与点
-        if len(self.current_polygon) >= 2:
-            self._draw_polygon(painter, self.current_polygon, self.current_color)
-        for pt in self.current_polygon:
-            self._draw_point(painter, pt, self.current_color)
-
-        painter.end()
-
-    def _draw_polygon(self, painter, points, color, region_number=None):
-        if len(points) < 2:
+            if len(region['points']) >= 3:
+                self._draw_region(painter, region, self.region_color, i + 1)
+
+        # 正在绘制的边与点（顶点缓冲区整体拷贝成 QPolygonF，一次调用画完）
+        if self._current_len:
+            current = ndarray_to_qpolygonf(self.current_polygon)
+            self._draw_polygon(painter, current, self.current_color)
+            self._draw_points(painter, current, self.current_color)
+
+    def _draw_region(self, painter, region, color, region_number):
+        """绘制已完成区域：填充、编号和闭合边线"""
+        painter.setPen(QPen(color, self.line_width))
+        fill = QColor(color)
+        fill.setAlpha(110)  # 更不透明
+        painter.setBrush(QBrush(fill))
+        painter.drawPolygon(region['qpolygon'])
+        self._draw_region_number(painter, region['centroid'], region_number)
+
+        # 边线（沿用编号绘制后的画笔），一次调用画完所有边
+        painter.drawLines(region['qlines'])
+
+    def _draw_polygon(self, painter, polygon, color):
+        """绘制正在绘制的多边形边线（一次 drawPolyline 画完所有边）"""
+        if polygon.size() < 2:
             return
-        pen = QPen(color, self.line_width)
+        painter.setPen(QPen(color, self.line_width))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawPolyline(polygon)
+
+    def _draw_points(self, painter, polygon, color):
+        """用圆头画笔一次 drawPoints 画出所有顶点（直径与原先半径为 point_radius 的圆点一致）"""
+        pen = QPen(color, 2 * self.point_radius + 1)
+        pen.setCapStyle(Qt.RoundCap)
         painter.setPen(pen)
+        painter.drawPoints(polygon)
 
-        if len(points) >= 3 and region_number is not None:
-            fill = QColor(color)
-            fill.setAlpha(110)  # 更不透明
-            painter.setBrush(QBrush(fill))
-            polygon = QPolygon([QPoint(int(p[0]), int(p[1])) for p in points])
-            painter.drawPolygon(polygon)
-            self._draw_region_number(painter, points, region_number)
-        else:
-            painter.setBrush(Qt.NoBrush)
-
-        # 边线
-        for i in range(len(points) - 1):
-            p1 = QPoint(int(points[i][0]), int(points[i][1]))
-            p2 = QPoint(int(points[i + 1][0]), int(points[i + 1][1]))
-            painter.drawLine(p1, p2)
-        if len(points) >= 3 and region_number is not None:
-            painter.drawLine(QPoint(int(points[-1][0]), int(points[-1][1])),
-                             QPoint(int(points[0][0]), int(points[0][1])))
-
-    def _draw_point(self, painter, point, color):
-        painter.setPen(QPen(color, 1))
-        painter.setBrush(QBrush(color))
-        c = QPoint(int(point[0]), int(point[1]))
-        painter.drawEllipse(c, self.point_radius, self.point_radius)
-
-    def _draw_region_number(self, painter, points, number):
-        if len(points) < 3:
-            return
-        cx = sum(p[0] for p in points) / len(points)
-        cy = sum(p[1] for p in points) / len(points)
+    def _draw_region_number(self, painter, centroid, number):
+        cx, cy = centroid
         painter.setFont(QFont("Arial", 12, QFont.Bold))
         bg = QColor(self.region_color); bg.setAlpha(220)
         painter.setBrush(QBrush(bg)); painter.setPen(QPen(bg))
@@ -144,7 +195,7 @@ class DrawingArea(QLabel):
     # ---- 坐标换算（无缩放，左上对齐）----
     def get_image_coordinates(self, widget_pos):
         """将 QLabel 坐标转换为原图像素坐标"""
-        if self.pixmap is None or self.image is None:
+        if self.base_pixmap is None or self.image is None:
             return None
         x = widget_pos.x()
         y = widget_pos.y()
@@ -169,19 +220,37 @@ class DrawingArea(QLabel):
             self.finish_current_polygon()
 
     def add_point_to_current_polygon(self, point):
-        self.current_polygon.append(point)
+        if self._current_len == len(self._current_buf):
+            # 容量不足时翻倍扩容
+            grown = np.empty((2 * len(self._current_buf), 2), dtype=np.float64)
+            grown[:self._current_len] = self._current_buf[:self._current_len]
+            self._current_buf = grown
+        self._current_buf[self._current_len] = point
+        self._current_len += 1
         self.is_drawing = True
-        self.update_display()
+        # 只重绘新增的边和点
+        self._schedule_update(self._dirty_rect(self.current_polygon[-2:], self._POINT_MARGIN))
 
     def finish_current_polygon(self):
-        if len(self.current_polygon) >= 3:
-            self.regions.append(self.current_polygon.copy())
-            self.region_added.emit(self.current_polygon.copy())
+        if self._current_len >= 3:
+            arr = self.current_polygon.copy()
+            polygon = [tuple(p) for p in arr.tolist()]
+            cx, cy = arr.mean(axis=0)
+            qpoints = [QPoint(x, y) for x, y in arr.astype(np.int32).tolist()]  # 闭合边线用
+            self.regions.append({
+                'points': polygon,
+                'centroid': (float(cx), float(cy)),
+                'qpolygon': ndarray_to_qpolygonf(arr),
+                'qlines': [QLine(qpoints[i - 1], qpoints[i]) for i in range(1, len(qpoints))]
+                          + [QLine(qpoints[-1], qpoints[0])],
+            })
+            self.region_added.emit(polygon.copy())
             self.clear_current_polygon()
-            self.update_display()
+            # 填充、闭合边和编号都在多边形包围盒内
+            self._schedule_update(self._dirty_rect(arr, self._REGION_MARGIN))
 
     def clear_current_polygon(self):
-        self.current_polygon = []
+        self._current_len = 0  # 缓冲区保留复用
         self.is_drawing = False
 
     def clear_all_regions(self):
@@ -195,7 +264,7 @@ class DrawingArea(QLabel):
             self.update_display()
 
     def get_regions(self):
-        return self.regions.copy()
+        return [region['points'] for region in self.regions]
 
 
 class RegionDrawingWidget(QWidget):
@@ -293,17 +362,30 @@ class RegionDrawingWidget(QWidget):
 
     def on_region_added(self, region_points):
         region_id = len(self.regions) + 1
-        self.regions.append({'id': region_id, 'points': region_points, 'name': f"区域 {region_id}"})
-        self.update_region_list()
+        self.regions.append({
+            'id': region_id,
+            'points': region_points,
+            'points_array': np.asarray(region_points, dtype=np.float64),  # 供几何计算复用
+            'name': f"区域 {region_id}"
+        })
+        # 只追加新区域对应的一项，不重建整个列表
+        self.region_list.addItem(self._make_region_item(self.regions[-1]))
+        self.delete_btn.setEnabled(True)
         self.regions_changed.emit(self.regions)
 
+    @staticmethod
+    def _region_item_text(region):
+        return f"{region['name']} ({len(region['points'])}个点)"
+
+    def _make_region_item(self, region):
+        item = QListWidgetItem(self._region_item_text(region))
+        item.setData(Qt.UserRole, region['id'])
+        return item
+
     def update_region_list(self):
         self.region_list.clear()
         for region in self.regions:
-            txt = f"{region['name']} ({len(region['points'])}个点)"
-            item = QListWidgetItem(txt)
-            item.setData(Qt.UserRole, region['id'])
-            self.region_list.addItem(item)
+            self.region_list.addItem(self._make_region_item(region))
         self.delete_btn.setEnabled(len(self.regions) > 0)
 
     def on_region_double_clicked(self, item):
@@ -315,11 +397,17 @@ class RegionDrawingWidget(QWidget):
         if row >= 0:
             self.drawing_area.remove_region(row)
             self.regions.pop(row)
-            # 重新编号
-            for i, r in enumerate(self.regions):
+            # 只移除对应的一项，并重新编号其后的区域（之前的编号不变）
+            self.region_list.takeItem(row)
+            for i in range(row, len(self.regions)):
+                r = self.regions[i]
                 r['id'] = i + 1
                 r['name'] = f"区域 {i + 1}"
-            self.update_region_list()
+                item = self.region_list.item(i)
+                item.setText(self._region_item_text(r))
+                item.setData(Qt.UserRole, r['id'])
+            self.region_list.setCurrentRow(-1)  # 与重建列表时一样，删除后不保留选中项
+            self.delete_btn.setEnabled(len(self.regions) > 0)
             self.regions_changed.emit(self.regions)
 
     def clear_all_regions(self):
@@ -332,8 +420,19 @@ class RegionDrawingWidget(QWidget):
         return self.regions.copy()
 
     def get_region_masks(self, image_size):
-        masks = []
-        for r in self.regions:
-            mask = create_polygon_mask(r['points'], image_size)
-            masks.append({'id': r['id'], 'name': r['name'], 'mask': mask, 'points': r['points']})
-        return masks
\ No newline at end of file
+        """
+        生成所有区域的遮罩
+
+        返回按字段分列的字典：'masks' 为连续的 (N, H, W) uint8 数组（区域内为 255），
+        第 i 个遮罩对应 'ids'[i]、'names'[i] 和 'points'[i]，便于对整批遮罩做向量化统计
+        """
+        w, h = image_size
+        masks = np.zeros((len(self.regions), h, w), dtype=np.uint8)
+        for i, r in enumerate(self.regions):
+            create_polygon_mask(r['points'], image_size, out=masks[i])
+        return {
+            'ids': np.array([r['id'] for r in self.regions], dtype=np.int32),
+            'names': [r['name'] for r in self.regions],
+            'masks': masks,
+            'points': [r['points'] for r in self.regions],
+        }
\ No newline at end of file
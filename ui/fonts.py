@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+共享字体
+各控件通过 get_font 复用同一批 QFont 对象，避免重复创建
+"""
+
+from functools import lru_cache
+
+from PyQt5.QtGui import QFont
+
+FONT_FAMILY = "Microsoft YaHei"
+
+
+@lru_cache(maxsize=None)
+def get_font(size, weight=QFont.Normal):
+    """获取共享字体（首次使用时创建，需在 QApplication 创建之后调用）"""
+    return QFont(FONT_FAMILY, size, weight)
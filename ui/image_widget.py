@@ -8,13 +8,20 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                            QPushButton, QFileDialog, QScrollArea, QFrame,
                            QButtonGroup, QRadioButton, QMessageBox)
-from PyQt5.QtCore import Qt, pyqtSignal, QMimeData
-from PyQt5.QtGui import QPixmap, QDragEnterEvent, QDropEvent, QPainter, QPen, QColor, QImage
+from PyQt5.QtCore import Qt, pyqtSignal, QMimeData, QTimer
+from PyQt5.QtGui import QPixmap, QDragEnterEvent, QDropEvent, QPainter, QPen, QColor
 import os
 from PIL import Image
 import numpy as np
 
 from core.utils import validate_image, resize_image, convert_image_format
+from core.qt_np import ndarray_to_qimage
+
+
+# 缩放金字塔层数（1/2、1/4、1/8）
+PYRAMID_LEVELS = 3
+# 缩放停止后多久用平滑插值重绘一次（毫秒）
+SMOOTH_RESCALE_DELAY_MS = 120
 
 
 class ImageDisplayLabel(QLabel):
@@ -78,7 +85,16 @@ class ImageWidget(QWidget):
         self.current_image = None
         self.current_pixmap = None
         self.original_image = None
+        self._img_array = None  # current_image 的像素数组，加载时生成一次，QImage 直接引用
+        self._pyramid = []      # 原图 QPixmap 及其逐级减半的缩小版本，按需生成
         self.scale_factor = 1.0
+        
+        # 交互缩放时先快速缩放，停止操作后再平滑重绘
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(SMOOTH_RESCALE_DELAY_MS)
+        self._smooth_timer.timeout.connect(lambda: self.update_pixmap(smooth=True))
+        
         self.init_ui()
     
     def init_ui(self):
@@ -185,9 +201,12 @@ class ImageWidget(QWidget):
             if pil_image.mode != 'RGB':
                 pil_image = pil_image.convert('RGB')
             
-            # 保存原始图像
-            self.original_image = pil_image.copy()
+            # 保存原始图像（程序不会原地修改图像，直接共享同一对象，无需整幅拷贝）
+            self.original_image = pil_image
             self.current_image = pil_image
+            # 只在加载时转换一次（像素字节只导出一次），缩放/适应窗口时复用
+            self._img_array = np.asarray(pil_image)
+            self._pyramid = []
             
             # 转换为QPixmap
             self.update_pixmap()
@@ -201,28 +220,46 @@ class ImageWidget(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "错误", f"加载图像失败：\n{str(e)}")
     
-    def update_pixmap(self):
+    def _pyramid_level(self, level):
+        """获取金字塔第 level 层（原图缩小 2^level 倍），首次使用时生成"""
+        if not self._pyramid:
+            # 将PIL图像转换为QPixmap（复用加载时缓存的数组，其引用保证 QImage 缓冲区有效）
+            if self._img_array is None:
+                self._img_array = np.asarray(self.current_image)
+            self._pyramid.append(QPixmap.fromImage(ndarray_to_qimage(self._img_array)))
+        
+        while len(self._pyramid) <= level:
+            prev = self._pyramid[-1]
+            self._pyramid.append(prev.scaled(prev.size() / 2, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        return self._pyramid[level]
+    
+    def update_pixmap(self, smooth=False):
         """更新QPixmap显示"""
         if self.current_image is None:
             return
         
-        # 将PIL图像转换为QPixmap
-        img_array = np.array(self.current_image)
-        height, width, channel = img_array.shape
-        bytes_per_line = 3 * width
-        
-        # from PyQt5.QtGui import QImage
-        q_image = QImage(img_array.data, width, height, bytes_per_line, QImage.Format_RGB888)
-        self.current_pixmap = QPixmap.fromImage(q_image)
+        base_pixmap = self._pyramid_level(0)
         
         # 应用缩放
-        if self.scale_factor != 1.0:
-            scaled_size = self.current_pixmap.size() * self.scale_factor
-            self.current_pixmap = self.current_pixmap.scaled(
+        if self.scale_factor == 1.0:
+            self._smooth_timer.stop()
+            self.current_pixmap = base_pixmap
+        else:
+            scaled_size = base_pixmap.size() * self.scale_factor
+            
+            # 从不小于目标尺寸的最小一层开始缩放，减少需要处理的像素
+            level = 0
+            while level < PYRAMID_LEVELS and self.scale_factor <= 0.5 ** (level + 1):
+                level += 1
+            
+            # 交互过程中用快速缩放，停止操作后由定时器触发一次平滑缩放
+            self.current_pixmap = self._pyramid_level(level).scaled(
                 scaled_size, 
                 Qt.KeepAspectRatio, 
-                Qt.SmoothTransformation
+                Qt.SmoothTransformation if smooth else Qt.FastTransformation
             )
+            if not smooth:
+                self._smooth_timer.start()
         
         # 显示图像
         self.image_label.setPixmap(self.current_pixmap)
@@ -266,17 +303,11 @@ class ImageWidget(QWidget):
         available_size.setWidth(available_size.width() - 20)  # 留出边距
         available_size.setHeight(available_size.height() - 20)
         
-        # 计算缩放比例
-        original_size = QPixmap.fromImage(
-            QImage(np.array(self.current_image).data, 
-                   self.current_image.size[0], 
-                   self.current_image.size[1], 
-                   3 * self.current_image.size[0], 
-                   QImage.Format_RGB888)
-        ).size()
+        # 计算缩放比例（直接使用原图尺寸，无需再构造 QPixmap）
+        original_width, original_height = self.current_image.size
         
-        scale_x = available_size.width() / original_size.width()
-        scale_y = available_size.height() / original_size.height()
+        scale_x = available_size.width() / original_width
+        scale_y = available_size.height() / original_height
         self.scale_factor = min(scale_x, scale_y, 1.0)  # 不超过原始大小
         
         self.update_pixmap()
@@ -9,8 +9,9 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
                              QSplitter, QMenuBar, QAction, QStatusBar, QToolBar,
                              QMessageBox, QProgressBar, QLabel)
 from PyQt5.QtCore import Qt, pyqtSignal, QTimer
-from PyQt5.QtGui import QIcon, QKeySequence
+from PyQt5.QtGui import QIcon, QImage, QKeySequence, QPixmap
 import os
+from functools import lru_cache
 
 from .image_widget import ImageWidget
 from .drawing_widget import RegionDrawingWidget
@@ -18,16 +19,42 @@ from .question_widget import QuestionInputWidget
 from .chat_widget import ChatHistoryWidget
 from core.model_manager import ModelManager
 
+REGION_UPDATE_DELAY_MS = 50  # 合并连续的区域变化，只刷新最后一次状态
+
+
+@lru_cache(maxsize=None)
+def _icon(path):
+    """获取共享图标，文件不存在时返回 None（同一路径只探测和解码一次）"""
+    if not os.path.exists(path):
+        return None
+    # 立即解码为 QPixmap，避免 QIcon 在首次绘制时才去读文件
+    return QIcon(QPixmap.fromImage(QImage(path)))
+
 
 class MainWindow(QMainWindow):
     """主窗口类"""
 
     def __init__(self):
         super().__init__()
-        self.model_manager = ModelManager()
+        # 模型管理器在窗口显示后再创建，不阻塞首次绘制
+        self.model_manager = None
+        # 推理任务在线程池中运行，期间拒绝重复提交
+        self._busy = False
+        # 区域变化合并刷新
+        self._pending_regions = None
+        self._region_update_timer = QTimer(self)
+        self._region_update_timer.setSingleShot(True)
+        self._region_update_timer.setInterval(REGION_UPDATE_DELAY_MS)
+        self._region_update_timer.timeout.connect(self._flush_region_update)
         self.init_ui()
-        self.connect_signals()
+        self.connect_ui_signals()
         self.setup_status_bar()
+        QTimer.singleShot(0, self._deferred_model_init)
+
+    def _deferred_model_init(self):
+        """创建模型管理器并连接其信号"""
+        self.model_manager = ModelManager()
+        self.connect_model_signals()
 
     def init_ui(self):
         """初始化用户界面"""
@@ -45,8 +72,9 @@ class MainWindow(QMainWindow):
         self.setup_tool_bar()
 
         # 设置窗口图标
-        if os.path.exists("resources/icons/app_icon.png"):
-            self.setWindowIcon(QIcon("resources/icons/app_icon.png"))
+        icon = _icon("resources/icons/app_icon.png")
+        if icon is not None:
+            self.setWindowIcon(icon)
 
     def setup_central_widget(self):
         """设置中央组件布局"""
@@ -84,13 +112,9 @@ class MainWindow(QMainWindow):
         # 区域绘制组件
         self.drawing_widget = RegionDrawingWidget()
 
-        # 垂直分割器
-        left_splitter = QSplitter(Qt.Vertical)
-        left_splitter.addWidget(self.image_widget)
-        left_splitter.addWidget(self.drawing_widget)
-        left_splitter.setSizes([600, 200])
-
-        left_layout.addWidget(left_splitter)
+        # 上下比例固定，用拉伸系数代替分割器
+        left_layout.addWidget(self.image_widget, 3)
+        left_layout.addWidget(self.drawing_widget, 1)
         left_widget.setLayout(left_layout)
 
         return left_widget
@@ -106,13 +130,9 @@ class MainWindow(QMainWindow):
         # 问题输入组件
         self.question_widget = QuestionInputWidget()
 
-        # 垂直分割器
-        right_splitter = QSplitter(Qt.Vertical)
-        right_splitter.addWidget(self.chat_widget)
-        right_splitter.addWidget(self.question_widget)
-        right_splitter.setSizes([600, 150])
-
-        right_layout.addWidget(right_splitter)
+        # 上下比例固定，用拉伸系数代替分割器
+        right_layout.addWidget(self.chat_widget, 4)
+        right_layout.addWidget(self.question_widget, 1)
         right_widget.setLayout(right_layout)
 
         return right_widget
@@ -173,8 +193,9 @@ class MainWindow(QMainWindow):
 
         # 打开图像
         open_action = QAction('打开图像', self)
-        if os.path.exists("resources/icons/open.png"):
-            open_action.setIcon(QIcon("resources/icons/open.png"))
+        icon = _icon("resources/icons/open.png")
+        if icon is not None:
+            open_action.setIcon(icon)
         open_action.triggered.connect(self.image_widget.open_image)
         toolbar.addAction(open_action)
 
@@ -182,15 +203,17 @@ class MainWindow(QMainWindow):
 
         # 清空区域
         clear_regions_action = QAction('清空区域', self)
-        if os.path.exists("resources/icons/clear.png"):
-            clear_regions_action.setIcon(QIcon("resources/icons/clear.png"))
+        icon = _icon("resources/icons/clear.png")
+        if icon is not None:
+            clear_regions_action.setIcon(icon)
         clear_regions_action.triggered.connect(self.drawing_widget.clear_all_regions)
         toolbar.addAction(clear_regions_action)
 
         # 清空对话
         clear_chat_action = QAction('清空对话', self)
-        if os.path.exists("resources/icons/chat_clear.png"):
-            clear_chat_action.setIcon(QIcon("resources/icons/chat_clear.png"))
+        icon = _icon("resources/icons/chat_clear.png")
+        if icon is not None:
+            clear_chat_action.setIcon(icon)
         clear_chat_action.triggered.connect(self.chat_widget.clear_history)
         toolbar.addAction(clear_chat_action)
 
@@ -200,7 +223,8 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
 
         # 状态标签
-        self.status_label = QLabel("就绪")
+        self._status_text = "就绪"
+        self.status_label = QLabel(self._status_text)
         self.status_bar.addWidget(self.status_label)
 
         # 进度条
@@ -212,8 +236,14 @@ class MainWindow(QMainWindow):
         self.model_status_label = QLabel("模型未加载")
         self.status_bar.addPermanentWidget(self.model_status_label)
 
-    def connect_signals(self):
-        """连接信号和槽"""
+    def _set_status(self, text):
+        """设置状态栏文本，内容未变化时不触发标签重新布局"""
+        if text != self._status_text:
+            self._status_text = text
+            self.status_label.setText(text)
+
+    def connect_ui_signals(self):
+        """连接界面组件的信号和槽"""
         # 图像加载完成后，传递给绘制组件
         self.image_widget.image_loaded.connect(self.drawing_widget.set_image)
 
@@ -223,14 +253,25 @@ class MainWindow(QMainWindow):
         # 区域变化信号
         self.drawing_widget.regions_changed.connect(self.update_region_info)
 
-        # 模型状态信号
-        self.model_manager.model_loaded.connect(self.on_model_loaded)
-        self.model_manager.inference_started.connect(self.on_inference_started)
-        self.model_manager.inference_finished.connect(self.on_inference_finished)
-        self.model_manager.error_occurred.connect(self.on_error_occurred)
+    def connect_model_signals(self):
+        """连接模型管理器的信号和槽"""
+        # 模型状态信号（显式排队连接，发送方不会被界面处理阻塞）
+        manager = self.model_manager
+        manager.model_loaded.connect(self.on_model_loaded, Qt.QueuedConnection)
+        manager.inference_started.connect(self.on_inference_started, Qt.QueuedConnection)
+        manager.inference_finished.connect(self.on_inference_finished, Qt.QueuedConnection)
+        manager.inference_progress.connect(self.on_inference_progress, Qt.QueuedConnection)
+        manager.error_occurred.connect(self.on_error_occurred, Qt.QueuedConnection)
 
     def handle_question(self, question):
         """处理用户问题"""
+        if self._busy:
+            return
+
+        if self.model_manager is None:
+            QMessageBox.information(self, "提示", "模型正在初始化，请稍后再试")
+            return
+
         if not self.image_widget.current_image:
             QMessageBox.warning(self, "警告", "请先上传图像！")
             return
@@ -241,7 +282,8 @@ class MainWindow(QMainWindow):
         # 添加用户消息到聊天历史
         self.chat_widget.add_user_message(question)
 
-        # 开始推理
+        # 开始推理（实际计算在 ModelManager 的线程池中进行，结果经信号回到主线程）
+        self._busy = True
         self.model_manager.process_question(
             question,
             self.image_widget.current_image,
@@ -249,9 +291,18 @@ class MainWindow(QMainWindow):
         )
 
     def update_region_info(self, regions):
-        """更新区域信息"""
-        region_count = len(regions)
-        self.status_label.setText(f"已绘制 {region_count} 个区域")
+        """更新区域信息（延迟合并，短时间内多次变化只刷新一次）"""
+        self._pending_regions = regions
+        self._region_update_timer.start()
+
+    def _flush_region_update(self):
+        """刷新合并后的区域信息"""
+        regions = self._pending_regions
+        self._pending_regions = None
+        if regions is None:
+            return
+
+        self._set_status(f"已绘制 {len(regions)} 个区域")
 
         # 更新问题输入组件的区域信息
         self.question_widget.update_regions(regions)
@@ -259,19 +310,25 @@ class MainWindow(QMainWindow):
     def on_model_loaded(self):
         """模型加载完成"""
         self.model_status_label.setText("模型已就绪")
-        self.status_label.setText("模型加载完成，可以开始问答")
+        self._set_status("模型加载完成，可以开始问答")
 
     def on_inference_started(self):
         """推理开始"""
         self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)  # 不确定进度
-        self.status_label.setText("正在生成回答...")
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
+        self._set_status("正在生成回答...")
         self.question_widget.setEnabled(False)
 
+    def on_inference_progress(self, value):
+        """推理进度更新"""
+        self.progress_bar.setValue(value)
+
     def on_inference_finished(self, answer):
         """推理完成"""
+        self._busy = False
         self.progress_bar.setVisible(False)
-        self.status_label.setText("回答生成完成")
+        self._set_status("回答生成完成")
         self.question_widget.setEnabled(True)
 
         # 添加助手回复到聊天历史
@@ -282,8 +339,9 @@ class MainWindow(QMainWindow):
 
     def on_error_occurred(self, error_msg):
         """处理错误"""
+        self._busy = False
         self.progress_bar.setVisible(False)
-        self.status_label.setText("发生错误")
+        self._set_status("发生错误")
         self.question_widget.setEnabled(True)
 
         QMessageBox.critical(self, "错误", f"处理过程中发生错误：\n{error_msg}")
@@ -311,7 +369,8 @@ class MainWindow(QMainWindow):
 
         if reply == QMessageBox.Yes:
             # 清理资源
-            self.model_manager.cleanup()
+            if self.model_manager is not None:
+                self.model_manager.cleanup()
             event.accept()
         else:
             event.ignore()
\ No newline at end of file
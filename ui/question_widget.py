@@ -7,10 +7,54 @@
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, 
                            QPushButton, QLabel, QFrame, QComboBox, QCompleter,
-                           QScrollArea, QButtonGroup, QToolButton, QMenu, QAction, QSizePolicy)
+                           QScrollArea, QButtonGroup, QToolButton, QMenu, QSizePolicy)
 from PyQt5.QtCore import Qt, pyqtSignal, QStringListModel
 from PyQt5.QtGui import QFont, QKeySequence, QTextCursor
 import re
+from collections import deque
+from functools import partial
+
+from .fonts import get_font
+
+QUESTION_HISTORY_LIMIT = 20  # 最多保留的历史问题数量
+
+# 问题中的区域标签，如 <region3>
+_REGION_RE = re.compile(r'<region(\d+)>')
+
+# 区域按钮样式：在 QuestionInputWidget 上设置一次，按类名匹配所有 RegionButton
+_REGION_BUTTON_QSS = """
+    RegionButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        border-radius: 12px;      /* 稍大圆角更像胶囊 */
+        padding: 5px 10px;
+        font-size: 12px;
+    }
+    RegionButton:hover {
+        background-color: #45a049;
+    }
+    RegionButton:pressed {
+        background-color: #3d8b40;
+    }
+"""
+
+_NO_REGIONS_QSS = "color: #888; font-style: italic;"
+
+# 常用问题按钮样式：在建议面板上设置一次，按 class 属性匹配
+_SUGGESTION_QSS = """
+    QPushButton[class="suggestion"] {
+        background-color: #f0f0f0;
+        color: #333333;                  /* 关 键 行：按钮文字设深色 */
+        border: 1px solid #ccc;
+        border-radius: 12px;
+        padding: 2px 10px;
+        font-size: 11px;
+    }
+    QPushButton[class="suggestion"]:hover {
+        background-color: #e0e0e0;
+    }
+"""
 
 
 class RegionButton(QPushButton):
@@ -24,23 +68,6 @@ class RegionButton(QPushButton):
         self.setToolTip(f"插入 <region{region_id}> 标签")
         self.setMaximumWidth(80)
         self.setMinimumHeight(32)
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 12px;      /* 稍大圆角更像胶囊 */
-                padding: 6px 12px;        /* 上下留足空间 */
-                padding: 5px 10px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
 
 
 class QuestionTextEdit(QTextEdit):
@@ -54,9 +81,12 @@ class QuestionTextEdit(QTextEdit):
         self.setMinimumHeight(80)
         self.setPlaceholderText("请输入您的问题...")
         
+        # 去除首尾空白后的文本缓存，文本变化时失效，读取时再生成
+        self._plain_stripped = None
+        self.textChanged.connect(self._invalidate_text_cache)
+        
         # 设置字体
-        font = QFont("Microsoft YaHei", 11)
-        self.setFont(font)
+        self.setFont(get_font(11))
 
         self.setObjectName("questionInput")
         # 样式设置
@@ -74,6 +104,15 @@ class QuestionTextEdit(QTextEdit):
                     }
                 """)
     
+    def _invalidate_text_cache(self):
+        self._plain_stripped = None
+    
+    def plain_text_stripped(self):
+        """获取去除首尾空白的纯文本（文本未变化时直接返回缓存）"""
+        if self._plain_stripped is None:
+            self._plain_stripped = self.toPlainText().strip()
+        return self._plain_stripped
+    
     def keyPressEvent(self, event):
         """处理键盘事件"""
         # Ctrl+Enter 提交
@@ -86,10 +125,8 @@ class QuestionTextEdit(QTextEdit):
     
     def insert_region_tag(self, region_id):
         """插入区域标签"""
-        cursor = self.textCursor()
-        tag = f"<region{region_id}>"
-        cursor.insertText(tag)
-        self.setTextCursor(cursor)
+        # 插入后光标自动移到标签之后；保留撤销记录，用户可以撤销误插的标签
+        self.insertPlainText(f"<region{region_id}>")
 
 
 class QuestionInputWidget(QWidget):
@@ -100,7 +137,10 @@ class QuestionInputWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.regions = []
-        self.question_history = []
+        self._region_id_set = set()
+        self._region_btns = {}  # region_id -> RegionButton
+        self.question_history = deque(maxlen=QUESTION_HISTORY_LIMIT)
+        self._history_set = set()  # 与 question_history 同步，用于 O(1) 去重
         self.history_index = -1
         self.init_ui()
         self.setup_shortcuts()
@@ -108,6 +148,7 @@ class QuestionInputWidget(QWidget):
     def init_ui(self):
         """初始化用户界面"""
         layout = QVBoxLayout()
+        self.setStyleSheet(_REGION_BUTTON_QSS)
         
         # 创建区域按钮面板
         self.create_region_buttons_panel(layout)
@@ -139,7 +180,7 @@ class QuestionInputWidget(QWidget):
         title_layout.setSpacing(8)
 
         title_label = QLabel("区域标签:")
-        title_label.setFont(QFont("Microsoft YaHei", 10, QFont.Bold))
+        title_label.setFont(get_font(10, QFont.Bold))
         title_layout.addWidget(title_label)
         title_layout.addStretch()
         
@@ -160,7 +201,7 @@ class QuestionInputWidget(QWidget):
         
         # 默认提示
         self.no_regions_label = QLabel("暂无区域，请先在图像上绘制区域")
-        self.no_regions_label.setStyleSheet("color: #888; font-style: italic;")
+        self.no_regions_label.setStyleSheet(_NO_REGIONS_QSS)
         self.region_buttons_layout.addWidget(self.no_regions_label)
         self.region_buttons_layout.addStretch()
         
@@ -174,7 +215,7 @@ class QuestionInputWidget(QWidget):
         """创建问题输入面板"""
         # 输入框标题
         input_title = QLabel("您的问题:")
-        input_title.setFont(QFont("Microsoft YaHei", 10, QFont.Bold))
+        input_title.setFont(get_font(10, QFont.Bold))
         parent_layout.addWidget(input_title)
         
         # 文本输入框
@@ -183,7 +224,6 @@ class QuestionInputWidget(QWidget):
         parent_layout.addWidget(self.text_edit)
 
         self.text_edit.setAcceptRichText(False)  # 纯文本，避免富文本带来的颜色干扰
-        self.text_edit.setWordWrapMode(self.text_edit.wordWrapMode())  # 按默认方式自动换行
         # 常用问题建议
         self.create_suggestion_panel(parent_layout)
     
@@ -191,13 +231,14 @@ class QuestionInputWidget(QWidget):
         """创建建议问题面板"""
         suggestion_frame = QFrame()
         suggestion_frame.setFrameStyle(QFrame.StyledPanel)
+        suggestion_frame.setStyleSheet(_SUGGESTION_QSS)
         # suggestion_frame.setMaximumHeight(50)
         
         suggestion_layout = QVBoxLayout()
         
         # 标题
         suggestion_title = QLabel("常用问题:")
-        suggestion_title.setFont(QFont("Microsoft YaHei", 9))
+        suggestion_title.setFont(get_font(9))
         suggestion_layout.addWidget(suggestion_title)
         
         # 建议按钮
@@ -217,20 +258,7 @@ class QuestionInputWidget(QWidget):
             btn = QPushButton(suggestion)
             btn.setMaximumHeight(28)
             btn.setProperty("class", "suggestion")  # ✅ 给一个 class，方便 QSS 定向
-            btn.setStyleSheet("""
-                    QPushButton[class="suggestion"] {
-                        background-color: #f0f0f0;
-                        color: #333333;                  /* 关 键 行：按钮文字设深色 */
-                        border: 1px solid #ccc;
-                        border-radius: 12px;
-                        padding: 2px 10px;
-                        font-size: 11px;
-                    }
-                    QPushButton[class="suggestion"]:hover {
-                        background-color: #e0e0e0;
-                    }
-                """)
-            btn.clicked.connect(lambda checked, text=suggestion: self.insert_suggestion(text))
+            btn.clicked.connect(partial(self.insert_suggestion, suggestion))
             suggestions_layout.addWidget(btn)
         
         suggestions_layout.addStretch()
@@ -249,6 +277,11 @@ class QuestionInputWidget(QWidget):
         self.history_btn.setEnabled(False)
         self.history_btn.clicked.connect(self.show_history_menu)
         
+        # 历史菜单只创建一次，历史变化后在下次弹出前重新填充
+        self._history_menu = QMenu(self)
+        self._history_menu.aboutToShow.connect(self._populate_history_menu)
+        self._history_menu_dirty = True
+        
         # 清空按钮
         self.clear_btn = QPushButton("清空")
         self.clear_btn.clicked.connect(self.clear_input)
@@ -295,34 +328,35 @@ class QuestionInputWidget(QWidget):
     def update_regions(self, regions):
         """更新区域信息"""
         self.regions = regions
+        self._region_id_set = {region['id'] for region in regions}
         self.update_region_buttons()
     
     def update_region_buttons(self):
-        """更新区域按钮"""
-        # 清空现有按钮
-        while self.region_buttons_layout.count():
-            child = self.region_buttons_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        
-        if not self.regions:
-            # 显示无区域提示
-            self.no_regions_label = QLabel("暂无区域，请先在图像上绘制区域")
-            self.no_regions_label.setStyleSheet("color: #888; font-style: italic;")
-            self.region_buttons_layout.addWidget(self.no_regions_label)
-        else:
-            # 添加区域按钮
-            for region in self.regions:
-                region_id = region['id']
-                region_name = region['name']
-                
-                btn = RegionButton(region_id, region_name)
-                btn.clicked.connect(
-                    lambda checked, rid=region_id: self.insert_region_tag(rid)
-                )
-                self.region_buttons_layout.addWidget(btn)
+        """更新区域按钮（只增删有变化的按钮，不整体重建）"""
+        new_regions = {region['id']: region for region in self.regions}
+        
+        # 移除已不存在的区域按钮
+        for region_id in self._region_btns.keys() - new_regions.keys():
+            btn = self._region_btns.pop(region_id)
+            self.region_buttons_layout.removeWidget(btn)
+            btn.setParent(None)
+            btn.deleteLater()
+        
+        # 添加新区域按钮（插在末尾的弹簧之前）
+        for region_id, region in new_regions.items():
+            btn = self._region_btns.get(region_id)
+            if btn is not None:
+                btn.region_name = region['name']
+                continue
+            btn = RegionButton(region_id, region['name'])
+            btn.clicked.connect(partial(self.insert_region_tag, region_id))
+            self.region_buttons_layout.insertWidget(
+                self.region_buttons_layout.count() - 1, btn
+            )
+            self._region_btns[region_id] = btn
         
-        self.region_buttons_layout.addStretch()
+        # 无区域时显示提示
+        self.no_regions_label.setVisible(not self._region_btns)
     
     def insert_region_tag(self, region_id):
         """插入区域标签"""
@@ -341,17 +375,20 @@ class QuestionInputWidget(QWidget):
     
     def submit_question(self):
         """提交问题"""
-        question = self.text_edit.toPlainText().strip()
+        question = self.text_edit.plain_text_stripped()
         
         if not question:
             self.text_edit.setFocus()
             return
         
         # 添加到历史记录
-        if question not in self.question_history:
+        if question not in self._history_set:
+            # 队列已满时 append 会挤掉最早的一条，先把它移出集合
+            if len(self.question_history) == self.question_history.maxlen:
+                self._history_set.discard(self.question_history[0])
             self.question_history.append(question)
-            if len(self.question_history) > 20:  # 限制历史记录数量
-                self.question_history.pop(0)
+            self._history_set.add(question)
+            self._history_menu_dirty = True
         
         # 更新历史按钮状态
         self.history_btn.setEnabled(len(self.question_history) > 0)
@@ -364,23 +401,25 @@ class QuestionInputWidget(QWidget):
         if not self.question_history:
             return
         
-        menu = QMenu(self)
+        # 在按钮下方显示菜单
+        self._history_menu.exec_(self.history_btn.mapToGlobal(
+            self.history_btn.rect().bottomLeft()
+        ))
+    
+    def _populate_history_menu(self):
+        """填充历史问题菜单（历史未变化时直接复用已有菜单项）"""
+        if not self._history_menu_dirty:
+            return
+        self._history_menu.clear()
         
         # 添加最近的10个问题
-        recent_questions = self.question_history[-10:]
+        recent_questions = list(self.question_history)[-10:]
         for question in reversed(recent_questions):
             # 限制显示长度
             display_text = question if len(question) <= 50 else question[:47] + "..."
-            action = QAction(display_text, self)
-            action.triggered.connect(
-                lambda checked, q=question: self.load_history_question(q)
-            )
-            menu.addAction(action)
-        
-        # 在按钮下方显示菜单
-        menu.exec_(self.history_btn.mapToGlobal(
-            self.history_btn.rect().bottomLeft()
-        ))
+            action = self._history_menu.addAction(display_text)
+            action.triggered.connect(partial(self.load_history_question, question))
+        self._history_menu_dirty = False
     
     def load_history_question(self, question):
         """加载历史问题"""
@@ -399,7 +438,7 @@ class QuestionInputWidget(QWidget):
     
     def get_current_question(self):
         """获取当前问题"""
-        return self.text_edit.toPlainText().strip()
+        return self.text_edit.plain_text_stripped()
     
     def set_enabled(self, enabled):
         """设置组件启用状态"""
@@ -409,15 +448,11 @@ class QuestionInputWidget(QWidget):
     
     def validate_question(self, question):
         """验证问题格式"""
-        # 检查区域标签格式
-        region_pattern = r'<region(\d+)>'
-        region_matches = re.findall(region_pattern, question)
-        
         # 检查引用的区域是否存在
-        region_ids = [region['id'] for region in self.regions]
-        for match in region_matches:
-            region_id = int(match)
-            if region_id not in region_ids:
+        # 逐个匹配，遇到第一个无效区域即返回
+        for match in _REGION_RE.finditer(question):
+            region_id = int(match.group(1))
+            if region_id not in self._region_id_set:
                 return False, f"引用的区域{region_id}不存在"
         
         return True, ""
\ No newline at end of file
@@ -4,7 +4,7 @@
 PyQt应用程序样式定义
 """
 
-from config.settings import STYLE_CONFIG
+from config.settings import STYLE_CONFIG, CHAT_CONFIG
 
 
 def get_main_style():
@@ -279,11 +279,10 @@ def get_drawing_style():
     """
 
 
-# 从配置导入聊天颜色
-from config.settings import CHAT_CONFIG
+# 完整样式表只在模块加载时拼接一次
+_FULL_STYLE = get_main_style() + get_chat_style() + get_drawing_style()
 
 
 def apply_styles(app):
     """应用所有样式到应用程序"""
-    style = get_main_style() + get_chat_style() + get_drawing_style()
-    app.setStyleSheet(style)
\ No newline at end of file
+    app.setStyleSheet(_FULL_STYLE)